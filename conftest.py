@@ -2,3 +2,10 @@ import sys
 import os
 
 sys.path.insert(0, os.path.dirname(__file__))
+
+
+def pytest_configure(config):
+    # Selected by default; deselect for quick local runs with -m "not slow".
+    config.addinivalue_line(
+        "markers", "slow: multi-seed headless simulations (~1 s)"
+    )
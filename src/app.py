@@ -15,6 +15,7 @@ from __future__ import annotations
 import argparse
 import sys
 import time
+from collections import deque
 from dataclasses import dataclass, field
 
 try:
@@ -38,13 +39,13 @@ from src.config import (
 from src.attract import AttractDemo
 from src.game import Game, GameState
 from src.models.city import CityManager
-from src.ui.audio import AudioManager, SoundEvent
+from src.ui.audio import AudioManager, SoundEvent, default_driver_cache_file
 from src.ui.audio_cues import AudioCueTracker
 from src.ui.high_scores import (
     load_scores, save_high_scores, update_high_scores, get_top_score,
     check_high_score,
 )
-from src.ui.renderer import Renderer, get_font
+from src.ui.renderer import Renderer, render_text
 
 
 # ── Constants ───────────────────────────────────────────────────────────────
@@ -52,6 +53,8 @@ from src.ui.renderer import Renderer, get_font
 FRAME_TIME: float = 1.0 / UPDATE_RATE          # ~16.67 ms
 IRQ_PER_FRAME: int = 4                          # 240 Hz / 60 Hz
 COLOR_CYCLE_IRQS: int = 8                       # 30 Hz color cycling
+MAX_CATCHUP_STEPS: int = 5                      # logic steps per rendered frame, max
+FPS_WINDOW_FRAMES: int = 60                     # rolling window for the FPS average
 
 MIN_SCALE: int = 1
 MAX_SCALE: int = 4
@@ -60,14 +63,29 @@ TALLY_CITY_TICK_INTERVAL_FRAMES: int = 10  # frames between each city tally tick
 TALLY_PHASE_PAUSE_FRAMES: int = 24  # pause between the ABM tally and city tally
 
 
-def _silo_key_map() -> dict[int, int]:
-    """Map keyboard keys to silo indices (A/S/D or 1/2/3)."""
-    if pygame is None:
-        return {}
-    return {
+#: Event types the main loop dispatches on (MOUSEMOTION is drained
+#: separately and coalesced -- see _handle_events).
+_HANDLED_EVENT_TYPES: tuple[int, ...] = (
+    (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN) if pygame else ()
+)
+
+#: The only event types SDL is allowed to queue (see ``init``);
+#: everything else -- joystick axes, touch, window/text events -- is
+#: dropped before it ever reaches the Python side.
+_ALLOWED_EVENT_TYPES: tuple[int, ...] = (
+    _HANDLED_EVENT_TYPES + (pygame.MOUSEMOTION,) if pygame else ()
+)
+
+
+#: Keyboard key -> silo index (A/S/D or 1/2/3). Built once at import
+#: rather than per keypress; pygame's K_* constants don't need init().
+_SILO_KEY_MAP: dict[int, int] = (
+    {
         pygame.K_a: 0, pygame.K_s: 1, pygame.K_d: 2,
         pygame.K_1: 0, pygame.K_2: 1, pygame.K_3: 2,
     }
+    if pygame else {}
+)
 
 
 # ── Argument parsing ───────────────────────────────────────────────────────
@@ -148,7 +166,6 @@ class MissileCommandApp:
 
     # Runtime state (initialized in ``init``)
     renderer: Renderer = field(default=None, repr=False)
-    clock: object = field(default=None, repr=False)
     game: Game = field(default_factory=Game)
     running: bool = False
 
@@ -178,10 +195,12 @@ class MissileCommandApp:
     _initials: list = field(default_factory=lambda: ["A", "A", "A"], repr=False)
     _initials_slot: int = field(default=0, repr=False)
     _initials_pending_score: int = field(default=0, repr=False)
+    _initials_drawn: tuple = field(default=(), repr=False)
 
     # Performance tracking
-    frame_times: list[float] = field(default_factory=list)
+    frame_times: deque = field(default_factory=lambda: deque(maxlen=FPS_WINDOW_FRAMES))
     fps: float = 0.0
+    _frame_time_sum: float = field(default=0.0, repr=False)
     defer_score_redraw: bool = False
 
     # Audio
@@ -226,13 +245,16 @@ class MissileCommandApp:
             pygame.quit()
             return False
 
-        self.clock = pygame.time.Clock()
         pygame.mouse.set_visible(False)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(_ALLOWED_EVENT_TYPES))
 
         # Load high scores and initialise audio
         self.high_scores = load_scores(self.scores_file)
         if self.mute:
             self.audio.enabled = False
+        if self.audio.driver_cache_file is None:
+            self.audio.driver_cache_file = default_driver_cache_file()
         success = self.audio.init()
         if success:
             print("Audio system initialized successfully")
@@ -258,28 +280,38 @@ class MissileCommandApp:
 
     def run(self) -> None:
         """Execute the main game loop at 60 FPS."""
-        if not self.running:
+        if not self.running or self.renderer is None:
             return
 
+        # Fixed-timestep loop: game logic always advances in whole
+        # FRAME_TIME steps (the arcade's 60 Hz tick), independent of how
+        # long rendering took; the remainder carries over in ``acc``.
+        acc = 0.0
+        prev = time.perf_counter()
         try:
             while self.running:
                 frame_start = time.perf_counter()
+                acc += frame_start - prev
+                prev = frame_start
 
                 self._handle_events()
-                self._simulate_irqs()
-                self._update()
+                steps = 0
+                while acc >= FRAME_TIME and steps < MAX_CATCHUP_STEPS:
+                    self._simulate_irqs()
+                    self._update()
+                    acc -= FRAME_TIME
+                    steps += 1
+                if steps == MAX_CATCHUP_STEPS:
+                    # Too far behind (window drag, debugger, ...) -- drop
+                    # the backlog rather than fast-forwarding the game.
+                    acc = 0.0
                 self._render()
 
-                self.clock.tick(UPDATE_RATE)
+                self._wait_for_next_frame(frame_start)
 
                 # Performance tracking
                 elapsed = time.perf_counter() - frame_start
-                self.frame_times.append(elapsed)
-                if len(self.frame_times) > 60:
-                    self.frame_times.pop(0)
-                if self.frame_times:
-                    avg = sum(self.frame_times) / len(self.frame_times)
-                    self.fps = 1.0 / avg if avg > 0 else 0.0
+                self._record_frame_time(elapsed)
 
                 # Defer score redraw on heavy frames
                 self.defer_score_redraw = elapsed > FRAME_TIME * 1.5
@@ -288,6 +320,32 @@ class MissileCommandApp:
         finally:
             self.shutdown()
 
+    def _record_frame_time(self, elapsed: float) -> None:
+        """Add *elapsed* to the rolling FPS window.
+
+        Keeps a running sum alongside the bounded deque so the average
+        costs O(1) per frame instead of re-summing the whole window.
+        """
+        times = self.frame_times
+        if len(times) == times.maxlen:
+            self._frame_time_sum -= times[0]  # evicted by the append below
+        times.append(elapsed)
+        self._frame_time_sum += elapsed
+        avg = self._frame_time_sum / len(times)
+        self.fps = 1.0 / avg if avg > 0 else 0.0
+
+    @staticmethod
+    def _wait_for_next_frame(frame_start: float) -> None:
+        """Sleep until FRAME_TIME after *frame_start*.
+
+        Oversleeping by a fraction of a millisecond is harmless: the
+        fixed-timestep accumulator in ``run`` carries it into the next
+        frame.
+        """
+        sleep_for = FRAME_TIME - (time.perf_counter() - frame_start)
+        if sleep_for > 0:
+            time.sleep(sleep_for)
+
     # ── Event handling ──────────────────────────────────────────────────
 
     def _get_target(self) -> tuple[int, int]:
@@ -349,6 +407,21 @@ class MissileCommandApp:
     #: auto-select -- confirmed against the original hardware).
     _MOUSE_BUTTON_SILO_MAP = {1: 0, 2: 1, 3: 2}
 
+    def _request_quit(self) -> None:
+        self.running = False
+
+    def _toggle_fullscreen(self) -> None:
+        self.renderer.toggle_fullscreen()
+        self._initials_drawn = ()
+
+    #: Keys that act the same in every app state (checked before any
+    #: state-dependent handling), dispatched by table rather than an
+    #: if-chain.
+    _GLOBAL_KEY_ACTIONS = (
+        {pygame.K_ESCAPE: _request_quit, pygame.K_F11: _toggle_fullscreen}
+        if pygame else {}
+    )
+
     def _handle_events(self) -> None:
         """Process pygame events.
 
@@ -367,28 +440,56 @@ class MissileCommandApp:
             Left / Right -- cycle the highlighted character
             Return/Space -- confirm it and advance to the next slot
         """
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
+        pygame.event.pump()
+
+        # Bind the dispatch constants once per call rather than paying a
+        # module-attribute lookup on ``pygame`` for every event.
+        ev_quit, ev_keydown, ev_mousebuttondown = _HANDLED_EVENT_TYPES
+        ev_motion = pygame.MOUSEMOTION
+        k_1 = pygame.K_1
+        global_keys = self._GLOBAL_KEY_ACTIONS
+
+        # Events are handled in queue order, but each run of consecutive
+        # MOUSEMOTION events is summed into one relative step, applied
+        # before the next non-motion event -- a click still fires at
+        # where the crosshair was when it happened, without one Python
+        # crosshair update per high-Hz mouse report.  The queue is read
+        # unfiltered: get() with a type list returns events grouped by
+        # type, not in queue order, and init() already blocks every type
+        # outside _ALLOWED_EVENT_TYPES.
+        moved = False
+        dx = dy = 0
+        for event in pygame.event.get(pump=False):
+            etype = event.type
+            if etype == ev_motion:
+                rel = event.rel
+                dx += rel[0]
+                dy += rel[1]
+                moved = True
+                continue
+            if moved:
+                self._move_crosshair((dx, dy))
+                moved = False
+                dx = dy = 0
 
-            elif event.type == pygame.MOUSEMOTION:
-                self._move_crosshair(event.rel)
+            if etype == ev_quit:
+                self.running = False
 
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.running = False
-                elif event.key == pygame.K_F11:
-                    self.renderer.toggle_fullscreen()
+            elif etype == ev_keydown:
+                key = event.key
+                action = global_keys.get(key)
+                if action is not None:
+                    action(self)
                 elif self._awaiting_initials:
                     self._handle_initials_keydown(event)
-                elif event.key == pygame.K_1 and self.game.state == GameState.ATTRACT:
+                elif key == k_1 and self.game.state == GameState.ATTRACT:
                     self._start_game_from_attract()
                 else:
-                    silo = _silo_key_map().get(event.key)
+                    silo = _SILO_KEY_MAP.get(key)
                     if silo is not None:
                         self._fire_silo(silo)
 
-            elif event.type == pygame.MOUSEBUTTONDOWN:
+            elif etype == ev_mousebuttondown:
                 if self._awaiting_initials:
                     if event.button == 1:
                         self._initials_slot += 1
@@ -397,6 +498,9 @@ class MissileCommandApp:
                     if silo is not None:
                         self._fire_silo(silo)
 
+        if moved:
+            self._move_crosshair((dx, dy))
+
         # Recenter the OS cursor each frame so relative motion keeps
         # working regardless of screen edges (trackball emulation).
         # set_pos() itself generates a synthetic MOUSEMOTION event (this
@@ -408,8 +512,7 @@ class MissileCommandApp:
         # frame was already consumed by the loop above, so it's safe
         # to drop anything left in the MOUSEMOTION queue here.
         if self.renderer is not None and self.renderer.window is not None:
-            win_w, win_h = self.renderer.window.get_size()
-            pygame.mouse.set_pos((win_w // 2, win_h // 2))
+            pygame.mouse.set_pos(self.renderer.window_center)
             pygame.event.clear(pygame.MOUSEMOTION)
 
     # ── IRQ simulation ──────────────────────────────────────────────────
@@ -417,13 +520,14 @@ class MissileCommandApp:
     def _simulate_irqs(self) -> None:
         """Simulate the 240 Hz IRQ handler (4× per frame).
 
-        Color cycling happens every 8 IRQs (30 Hz).
+        Color cycling happens every 8 IRQs (30 Hz). Nothing observes the
+        counters between individual IRQs, so a frame's worth is applied
+        in one step.
         """
-        for _ in range(IRQ_PER_FRAME):
-            self.irq_counter += 1
-            self.color_cycle_counter += 1
-            if self.color_cycle_counter >= COLOR_CYCLE_IRQS:
-                self.color_cycle_counter = 0
+        self.irq_counter += IRQ_PER_FRAME
+        self.color_cycle_counter = (
+            (self.color_cycle_counter + IRQ_PER_FRAME) % COLOR_CYCLE_IRQS
+        )
 
     # ── Game logic update ───────────────────────────────────────────────
 
@@ -446,33 +550,41 @@ class MissileCommandApp:
 
         prev = self.game.state
         self.game.update()
-
-        if prev != GameState.GAME_OVER and self.game.state == GameState.GAME_OVER:
+        state = self.game.state
+        handler = self._STATE_UPDATERS.get(state)
+        if handler is not None:
+            handler(self, state is not prev)
+
+    def _update_game_over(self, entered: bool) -> None:
+        """Game-over hold: start the jingle on entry, then after the
+        display delay either prompt for initials or return to attract."""
+        if entered:
             self.audio_cues.stop_all_loops(self.audio)
             self.audio.play(SoundEvent.GAME_OVER)
             self.game_over_timer = 0
             self._game_over_initials_done = False
             return
+        self.game_over_timer += 1
+        if (
+            self.game_over_timer >= GAME_OVER_DISPLAY_FRAMES
+            and not self._game_over_initials_done
+        ):
+            self._game_over_initials_done = True
+            score = self.game.score_display.player_score
+            score_pos = check_high_score(score, self.high_scores)
+            if score_pos > 0:
+                self._initials = ["A", "A", "A"]
+                self._initials_slot = 0
+                self._initials_pending_score = score
+                self._initials_drawn = ()
+                self._awaiting_initials = True
+            else:
+                self._reset_to_attract()
 
-        if self.game.state == GameState.GAME_OVER:
-            self.game_over_timer += 1
-            if (
-                self.game_over_timer >= GAME_OVER_DISPLAY_FRAMES
-                and not self._game_over_initials_done
-            ):
-                self._game_over_initials_done = True
-                score = self.game.score_display.player_score
-                score_pos = check_high_score(score, self.high_scores)
-                if score_pos > 0:
-                    self._initials = ["A", "A", "A"]
-                    self._initials_slot = 0
-                    self._initials_pending_score = score
-                    self._awaiting_initials = True
-                else:
-                    self._reset_to_attract()
-            return
-
-        if prev != GameState.WAVE_END and self.game.state == GameState.WAVE_END:
+    def _update_wave_end(self, entered: bool) -> None:
+        """Wave-end tally: reset the count-up on entry, then tick ABMs
+        and cities with their sounds until the display timer runs out."""
+        if entered:
             self.audio_cues.stop_all_loops(self.audio)
             self.audio.play(SoundEvent.WAVE_END)
             self.wave_end_timer = WAVE_END_DISPLAY_FRAMES
@@ -484,57 +596,64 @@ class MissileCommandApp:
             self._tally_phase_pause_remaining = TALLY_PHASE_PAUSE_FRAMES
             self._bonus_city_announced = False
             return
-
-        if self.game.state == GameState.WAVE_END:
-            self.wave_end_timer -= 1
-            if self.tally_ticks_done < self.tally_ticks_total:
-                # A brief pause between the ABM tally finishing and the
-                # city tally starting, so the two feel like distinct
-                # phases rather than one continuous count-up.
-                at_phase_boundary = (
-                    self.tally_ticks_done == self.game.last_wave_remaining_abms
-                    and self.game.last_wave_remaining_abms > 0
+        self.wave_end_timer -= 1
+        if self.tally_ticks_done < self.tally_ticks_total:
+            # A brief pause between the ABM tally finishing and the
+            # city tally starting, so the two feel like distinct
+            # phases rather than one continuous count-up.
+            at_phase_boundary = (
+                self.tally_ticks_done == self.game.last_wave_remaining_abms
+                and self.game.last_wave_remaining_abms > 0
+            )
+            if at_phase_boundary and self._tally_phase_pause_remaining > 0:
+                self._tally_phase_pause_remaining -= 1
+            else:
+                in_city_phase = (
+                    self.tally_ticks_done >= self.game.last_wave_remaining_abms
                 )
-                if at_phase_boundary and self._tally_phase_pause_remaining > 0:
-                    self._tally_phase_pause_remaining -= 1
-                else:
-                    in_city_phase = (
-                        self.tally_ticks_done >= self.game.last_wave_remaining_abms
-                    )
-                    # Cities tick noticeably slower than ABMs -- there are
-                    # far fewer of them, so a fast count-up reads as a blur.
-                    tick_interval = (
-                        TALLY_CITY_TICK_INTERVAL_FRAMES
+                # Cities tick noticeably slower than ABMs -- there are
+                # far fewer of them, so a fast count-up reads as a blur.
+                tick_interval = (
+                    TALLY_CITY_TICK_INTERVAL_FRAMES
+                    if in_city_phase
+                    else TALLY_TICK_INTERVAL_FRAMES
+                )
+                self.tally_tick_frame_counter += 1
+                if self.tally_tick_frame_counter >= tick_interval:
+                    self.tally_tick_frame_counter = 0
+                    # ABMs are tallied first, then surviving cities -- each
+                    # phase gets its own "roll up" sound (see data/sfx/README.md).
+                    tick_event = (
+                        SoundEvent.TALLY_TICK_CITY
                         if in_city_phase
-                        else TALLY_TICK_INTERVAL_FRAMES
+                        else SoundEvent.TALLY_TICK_ABM
                     )
-                    self.tally_tick_frame_counter += 1
-                    if self.tally_tick_frame_counter >= tick_interval:
-                        self.tally_tick_frame_counter = 0
-                        # ABMs are tallied first, then surviving cities -- each
-                        # phase gets its own "roll up" sound (see data/sfx/README.md).
-                        tick_event = (
-                            SoundEvent.TALLY_TICK_CITY
-                            if in_city_phase
-                            else SoundEvent.TALLY_TICK_ABM
-                        )
-                        self.tally_ticks_done += 1
-                        self.audio.play(tick_event)
-            elif (
-                not self._bonus_city_announced
-                and self.game.last_wave_bonus_cities_awarded > 0
-            ):
-                # City points have finished tallying -- announce any bonus
-                # city earned this wave.
-                self._bonus_city_announced = True
-                self.audio.play(SoundEvent.BONUS_CITY)
-            if self.wave_end_timer <= 0:
-                self.audio_cues.reset_for_new_wave()
-                self._begin_wave_intro()
-            return
-
-        if self.game.state == GameState.RUNNING:
-            self.audio_cues.update(self.game, self.audio)
+                    self.tally_ticks_done += 1
+                    self.audio.play(tick_event)
+        elif (
+            not self._bonus_city_announced
+            and self.game.last_wave_bonus_cities_awarded > 0
+        ):
+            # City points have finished tallying -- announce any bonus
+            # city earned this wave.
+            self._bonus_city_announced = True
+            self.audio.play(SoundEvent.BONUS_CITY)
+        if self.wave_end_timer <= 0:
+            self.audio_cues.reset_for_new_wave()
+            self._begin_wave_intro()
+
+    def _update_running(self, _entered: bool) -> None:
+        """Normal play: drive the state-dependent audio cues."""
+        self.audio_cues.update(self.game, self.audio)
+
+    #: Per-state follow-up to Game.update(), dispatched by table rather
+    #: than an if-chain. Each handler is told whether the state was
+    #: entered this frame. ATTRACT never reaches here (see _update).
+    _STATE_UPDATERS = {
+        GameState.GAME_OVER: _update_game_over,
+        GameState.WAVE_END: _update_wave_end,
+        GameState.RUNNING: _update_running,
+    }
 
     def _update_initials_entry(self) -> None:
         """Check whether initials entry is complete.
@@ -633,17 +752,24 @@ class MissileCommandApp:
                 ch, color = current_char, (255, 220, 0)
             else:
                 ch, color = "_", (120, 120, 120)
-            surf = get_font(14).render(ch, True, color)
+            surf = render_text(ch, 14, color)
             self.renderer.native.blit(surf, (start_x + i * slot_w, 100))
 
     # ── Rendering ───────────────────────────────────────────────────────
 
     def _render(self) -> None:
-        """Execute the rendering pipeline."""
-        if self.renderer is None:
-            return
+        """Execute the rendering pipeline.
 
+        Only reachable via ``run()``, which requires a successful
+        ``init()`` -- so the renderer is never None here.
+        """
         if self._awaiting_initials:
+            # The entry screen is static between inputs -- only redraw
+            # (and re-present) when a letter or the active slot changes.
+            drawn = (tuple(self._initials), self._initials_slot)
+            if drawn == self._initials_drawn:
+                return
+            self._initials_drawn = drawn
             active_char = (
                 self._initials[self._initials_slot]
                 if self._initials_slot < 3
@@ -678,7 +804,7 @@ class MissileCommandApp:
         self._center_text("GET READY", 7, 110)
 
     def _center_text(self, text: str, size: int, y: int, color=(255, 255, 255)) -> None:
-        surf = get_font(size).render(text, True, color)
+        surf = render_text(text, size, color)
         x = SCREEN_WIDTH // 2 - surf.get_width() // 2
         self.renderer.native.blit(surf, (x, y))
 
@@ -692,15 +818,17 @@ class MissileCommandApp:
         title/subtitle and the ground line."""
         self._center_text("HIGH SCORES", 8, 78)
         y = 93
+        rows = []
         for pos in [str(i) for i in range(1, 11)]:
             record = self.high_scores.get(pos)
             if not record:
                 continue
             name = str(record.get("name", "---"))[:3].ljust(3)
             score = int(record.get("score", 0) or 0)
-            line = f"{pos.rjust(2)}. {name}  {score:06d}"
-            self._center_text(line, 6, y)
+            surf = render_text(f"{pos.rjust(2)}. {name}  {score:06d}", 6, (255, 255, 255))
+            rows.append((surf, (SCREEN_WIDTH // 2 - surf.get_width() // 2, y)))
             y += 8
+        self.renderer.native.blits(rows, doreturn=False)
 
     def _render_wave_end(self) -> None:
         mult = self.game.multiplier
@@ -16,9 +16,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
-from src.config import SCREEN_HEIGHT, SCREEN_WIDTH
+from src.config import FIXED_POINT_SHIFT, SCREEN_HEIGHT, SCREEN_WIDTH
 from src.game import Game, GameState
-from src.models.missile import from_fixed
 
 TARGET_LEAD_FRAMES = 16
 MAX_CONCURRENT_ABMS = 2
@@ -74,4 +73,4 @@ class AttractDemo:
         """Predict where *missile* will be in *frames* frames."""
         x_fp = missile.current_x_fp + missile.x_increment * frames
         y_fp = missile.current_y_fp + missile.y_increment * frames
-        return from_fixed(x_fp), from_fixed(y_fp)
+        return x_fp >> FIXED_POINT_SHIFT, y_fp >> FIXED_POINT_SHIFT
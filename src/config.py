@@ -43,11 +43,11 @@ SILO_LOW_THRESHOLD: int = 3  # "LOW" HUD indicator / warning at this many left
 # Silo X positions, scaled proportionally from the original arcade's
 # 256-wide layout (32, 128, 224) to fill the widened 410px playfield.
 # Center silo stays exactly at SCREEN_WIDTH // 2.
-SILO_POSITIONS: list[tuple[int, int]] = [
+SILO_POSITIONS: tuple[tuple[int, int], ...] = (
     (51, 220),    # left silo   (index 0)
     (205, 220),   # center silo (index 1)
     (359, 220),   # right silo  (index 2)
-]
+)
 SILO_Y: int = 220  # ground-level Y for all silos
 
 # ---------------------------------------------------------------------------
@@ -58,14 +58,14 @@ MAX_CITIES_DESTROYED_PER_WAVE: int = 3
 
 # City X positions, scaled proportionally from the original arcade's
 # 256-wide layout to fill the widened 410px playfield (Y sits on ground).
-CITY_POSITIONS: list[tuple[int, int]] = [
+CITY_POSITIONS: tuple[tuple[int, int], ...] = (
     (77, 216),
     (115, 216),
     (154, 216),
     (256, 216),
     (295, 216),
     (333, 216),
-]
+)
 CITY_Y: int = 216
 
 # ---------------------------------------------------------------------------
@@ -131,18 +131,18 @@ POINTS_PER_SURVIVING_CITY: int = 100
 # disassembly values, not a research error -- SPEC.md's "disassembly wins"
 # default is overridden here by explicit, repeated user direction after
 # hands-on testing.
-ICBM_MOVE_DELAY_TABLE: list[float] = [
+ICBM_MOVE_DELAY_TABLE: tuple[float, ...] = (
     9.9, 7.7, 5.8, 4.5, 3.4, 2.5, 1.9, 1.3,
     0.9, 0.6, 0.4, 0.25, 0.15, 0.06, 0.0,
-]
+)
 ICBM_BASE_STEP_SPEED: int = 1  # units advanced per actual move (constant)
 
 # ICBMs launched per wave (1-indexed by position; wave 20+ reuses the
 # last entry). Source: https://6502disassembly.com/va-missile-command/wave-guide.html
-ICBM_COUNT_TABLE: list[int] = [
+ICBM_COUNT_TABLE: tuple[int, ...] = (
     12, 15, 18, 12, 16, 14, 17, 10, 13, 16,
     19, 12, 14, 16, 18, 14, 17, 19, 22,
-]
+)
 
 # Attack pacing altitude = 202 - 2 * wave_number, minimum 180
 ATTACK_PACE_BASE: int = 202
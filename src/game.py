@@ -13,6 +13,7 @@ References:
 from __future__ import annotations
 
 import random
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Optional
@@ -20,6 +21,7 @@ from typing import Optional
 from src.config import (
     ATTACK_BATCH_SIZE,
     EXPLOSION_MAX_RADIUS,
+    FIXED_POINT_SHIFT,
     FLIER_INITIAL_DELAY_FRAMES,
     FLIER_START_WAVE,
     GROUND_Y,
@@ -28,6 +30,7 @@ from src.config import (
     MAX_ICBM_SLOTS,
     MAX_SMART_BOMBS,
     MIRV_ALTITUDE_HIGH,
+    MIRV_ALTITUDE_LOW,
     POINTS_PER_FLIER,
     POINTS_PER_ICBM,
     POINTS_PER_SMART_BOMB,
@@ -43,6 +46,7 @@ from src.models.explosion import Explosion, ExplosionManager
 from src.models.missile import (
     ABM,
     ICBM,
+    KIND_SMART_BOMB,
     Flier,
     MissileSlotManager,
     SmartBomb,
@@ -70,6 +74,9 @@ class GameState(Enum):
 
 # ── Game ────────────────────────────────────────────────────────────────────
 
+#: Interception points indexed by an ICBM-table occupant's ``kind``.
+POINTS_BY_KIND: tuple[int, ...] = (POINTS_PER_ICBM, POINTS_PER_SMART_BOMB)
+
 
 @dataclass
 class Game:
@@ -101,8 +108,11 @@ class Game:
 
     # Persistent terrain scarring: X positions of ground craters bitten
     # by explosions that touched the ground line. Not reset per wave --
-    # lasts the whole game, matching the original arcade.
-    ground_craters: list[int] = field(default_factory=list)
+    # lasts the whole game, matching the original arcade. Bounded deque:
+    # the oldest crater falls off in O(1) once MAX_GROUND_CRATERS is hit.
+    ground_craters: deque[int] = field(
+        default_factory=lambda: deque(maxlen=MAX_GROUND_CRATERS),
+    )
 
     # ── Wave lifecycle ──────────────────────────────────────────────────
 
@@ -176,35 +186,36 @@ class Game:
         self.missiles.clear_inactive()
 
         # 6. Update explosions (one group per frame).
-        updated_explosions = self.explosions.update()
-
-        # 7. Collision: explosions vs ICBMs/smart bombs.
-        icbm_positions = []
-        for i, slot in enumerate(self.missiles.icbm_slots):
-            if slot is not None and slot.is_active:
-                icbm_positions.append((slot.current_x, slot.current_y, i))
-        hit_indices = self.explosions.check_icbm_collisions(
-            updated_explosions, icbm_positions
-        )
-        for idx in set(hit_indices):
-            slot = self.missiles.icbm_slots[idx]
-            if slot is not None and slot.is_active:
-                pts = (
-                    POINTS_PER_SMART_BOMB
-                    if isinstance(slot, SmartBomb)
-                    else POINTS_PER_ICBM
-                )
-                self.score_display.add(pts * self.multiplier)
-                slot.intercept()
+        live_explosions = self.explosions.advance()
+
+        # 7. Collision: explosions vs ICBMs/smart bombs. Only the group
+        #    drawn this frame is tested, and on most frames that group
+        #    has nothing live in it -- skip gathering ICBM positions then.
+        if live_explosions:
+            icbm_slots = self.missiles.icbm_slots
+            icbm_positions = [
+                (slot.current_x_fp >> FIXED_POINT_SHIFT,
+                 slot.current_y_fp >> FIXED_POINT_SHIFT, i)
+                for i, slot in enumerate(icbm_slots)
+                if slot is not None and slot.is_active
+            ]
+            hit_indices = self.explosions.check_group_collisions(icbm_positions)
+            for idx in hit_indices:
+                slot = icbm_slots[idx]
+                if slot is not None and slot.is_active:
+                    pts = POINTS_BY_KIND[slot.kind]
+                    self.score_display.add(pts * self.multiplier)
+                    slot.intercept()
 
         # 8. Collision: explosions vs flier.
         flier = self.missiles.flier_slot
-        if flier is not None and flier.is_active:
-            for exp in updated_explosions:
-                if exp.collides_with(flier.current_x, flier.altitude):
-                    self.score_display.add(POINTS_PER_FLIER * self.multiplier)
-                    flier.deactivate()
-                    break
+        if (
+            live_explosions
+            and flier is not None and flier.is_active
+            and self.explosions.group_collides_with(flier.current_x, flier.altitude)
+        ):
+            self.score_display.add(POINTS_PER_FLIER * self.multiplier)
+            flier.deactivate()
 
         # 9. Bonus cities: award new ones, then spend banked ones to
         #    patch any craters immediately.
@@ -280,8 +291,6 @@ class Game:
         if y + radius < GROUND_Y:
             return
         self.ground_craters.append(x)
-        if len(self.ground_craters) > MAX_GROUND_CRATERS:
-            self.ground_craters.pop(0)
 
     # ── MIRV ──────────────────────────────────────────────────────────────
 
@@ -295,7 +304,15 @@ class Game:
             if missile is None or not missile.is_active or not isinstance(missile, ICBM):
                 continue
 
-            if not missile.has_mirved and missile.can_mirv:
+            alt = missile.current_y_fp >> FIXED_POINT_SHIFT
+            # Band and ordering rejects first: most missiles are outside
+            # the MIRV band, and check_mirv_conditions' count argument
+            # rescans the slot table.
+            if (
+                not seen_above_high
+                and MIRV_ALTITUDE_LOW <= alt <= MIRV_ALTITUDE_HIGH
+                and not missile.has_mirved and missile.can_mirv
+            ):
                 eligible = ICBM.check_mirv_conditions(
                     missile,
                     active_icbm_count=self.missiles.active_icbm_count,
@@ -314,7 +331,7 @@ class Game:
                         if self.missiles.add_icbm(child):
                             self.icbms_remaining_this_wave -= 1
 
-            if missile.altitude > MIRV_ALTITUDE_HIGH:
+            if alt > MIRV_ALTITUDE_HIGH:
                 seen_above_high = True
 
     # ── Target selection (mercy-rule aware) ──────────────────────────────
@@ -440,15 +457,15 @@ class Game:
         centers = self.explosions.active_explosion_centers
         if not centers:
             for missile in self.missiles.icbm_slots:
-                if isinstance(missile, SmartBomb) and missile.is_active:
-                    missile.detect_explosions([])
+                if missile is not None and missile.kind == KIND_SMART_BOMB and missile.is_active:
+                    missile.detect_explosions(())
             return
         for missile in self.missiles.icbm_slots:
-            if isinstance(missile, SmartBomb) and missile.is_active:
+            if missile is not None and missile.kind == KIND_SMART_BOMB and missile.is_active:
+                x, y = missile.current_pos
                 nearby = [
                     c for c in centers
-                    if distance_approx(missile.current_x, missile.current_y, c[0], c[1])
-                    <= SMART_BOMB_EVASION_RADIUS
+                    if distance_approx(x, y, c[0], c[1]) <= SMART_BOMB_EVASION_RADIUS
                 ]
                 missile.detect_explosions(nearby)
 
@@ -31,7 +31,7 @@ from src.config import (
 # ── City ────────────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class City:
     """A single city on the ground line.
 
@@ -43,10 +43,12 @@ class City:
     position_y: int
     is_destroyed: bool = False
     is_active: bool = True
+    # Cities never move, so the (x, y) tuple is built once here rather
+    # than allocated on every access.
+    position: tuple[int, int] = field(init=False, repr=False, compare=False)
 
-    @property
-    def position(self) -> tuple[int, int]:
-        return (self.position_x, self.position_y)
+    def __post_init__(self) -> None:
+        self.position = (self.position_x, self.position_y)
 
     def destroy(self) -> None:
         """Mark the city as destroyed."""
@@ -62,7 +64,7 @@ class City:
 # ── City Manager ────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class CityManager:
     """Manages all cities, bonus awards, and per-wave destruction limits.
 
@@ -150,12 +152,12 @@ class CityManager:
         """
         if self.bonus_threshold <= 0:
             return 0
-        awarded = 0
-        while current_score - self._last_bonus_score >= self.bonus_threshold:
-            self._last_bonus_score += self.bonus_threshold
-            # 8-bit overflow matching original hardware
-            self.bonus_cities = (self.bonus_cities + 1) & 0xFF
-            awarded += 1
+        awarded = (current_score - self._last_bonus_score) // self.bonus_threshold
+        if awarded <= 0:
+            return 0
+        self._last_bonus_score += awarded * self.bonus_threshold
+        # 8-bit overflow matching original hardware
+        self.bonus_cities = (self.bonus_cities + awarded) & 0xFF
         return awarded
 
     def replace_random_crater(self) -> bool:
@@ -165,13 +167,19 @@ class CityManager:
         """
         if self.bonus_cities <= 0:
             return False
-        craters = [
-            i for i, c in enumerate(self.cities) if c.is_destroyed
-        ]
-        if not craters:
+        craters = len(self.cities) - self.active_count
+        if craters == 0:
             return False
-        idx = random.choice(craters)
-        self.cities[idx].restore()
+        # Draw the crater's rank directly instead of building a list of
+        # crater indices to choose from; randrange(n) consumes the RNG
+        # exactly as random.choice over an n-item list would.
+        nth = random.randrange(craters)
+        for city in self.cities:
+            if city.is_destroyed:
+                if nth == 0:
+                    city.restore()
+                    break
+                nth -= 1
         self.bonus_cities = (self.bonus_cities - 1) & 0xFF
         return True
 
@@ -189,11 +197,17 @@ class CityManager:
 
     @property
     def active_cities(self) -> list[City]:
+        """Surviving cities (allocates -- prefer ``active_count`` for checks)."""
         return [c for c in self.cities if not c.is_destroyed]
 
     @property
     def active_count(self) -> int:
-        return len(self.active_cities)
+        """Surviving cities, counted without building a list.
+
+        Derived from ``cities`` on every call so it can never disagree
+        with direct ``City.destroy()`` / ``City.restore()`` calls.
+        """
+        return sum(not c.is_destroyed for c in self.cities)
 
     @property
     def total_cities(self) -> int:
@@ -202,7 +216,7 @@ class CityManager:
 
     @property
     def all_destroyed(self) -> bool:
-        return self.active_count == 0 and self.bonus_cities == 0
+        return self.bonus_cities == 0 and self.active_count == 0
 
     @property
     def destroyed_cities(self) -> list[City]:
@@ -11,6 +11,7 @@ References:
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -26,7 +27,7 @@ from src.models.missile import ABM
 # ── Defense Silo ────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class DefenseSilo:
     """A single defensive missile silo.
 
@@ -42,10 +43,11 @@ class DefenseSilo:
     position_y: int
     abm_count: int = SILO_CAPACITY
     is_destroyed: bool = False
+    # Fixed for the silo's lifetime; built once instead of per access.
+    position: tuple[int, int] = field(init=False, repr=False, compare=False)
 
-    @property
-    def position(self) -> tuple[int, int]:
-        return (self.position_x, self.position_y)
+    def __post_init__(self) -> None:
+        self.position = (self.position_x, self.position_y)
 
     def can_fire(self) -> bool:
         """Return True if this silo can launch an ABM."""
@@ -59,16 +61,10 @@ class DefenseSilo:
         Note: The caller must also check the global 8-ABM limit before
         accepting the returned ABM.
         """
-        if not self.can_fire():
+        if self.is_destroyed or self.abm_count <= 0:
             return None
         self.abm_count -= 1
-        return ABM(
-            silo_index=self.silo_index,
-            start_x=self.position_x,
-            start_y=self.position_y,
-            target_x=target_x,
-            target_y=target_y,
-        )
+        return ABM(self.silo_index, self.position_x, self.position_y, target_x, target_y)
 
     def restore(self) -> None:
         """Restore the silo to full capacity for a new wave."""
@@ -82,7 +78,7 @@ class DefenseSilo:
 # ── Defense Manager ─────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class DefenseManager:
     """Manages all 3 defense silos and enforces the 8-ABM global limit.
 
@@ -90,10 +86,20 @@ class DefenseManager:
     """
 
     silos: list[DefenseSilo] = field(default_factory=list)
+    # Silos ordered by x, and their x positions, for fire_nearest's
+    # bisect. Positions never change, so this is built once.
+    _by_x: list[DefenseSilo] = field(init=False, repr=False, compare=False)
+    _xs: list[int] = field(init=False, repr=False, compare=False)
+    # Each silo's bound fire(), indexed by silo_index, so fire() is one
+    # tuple index instead of a bounds check, a list index and a lookup.
+    _silo_fire: tuple = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.silos:
             self._init_silos()
+        self._by_x = sorted(self.silos, key=lambda s: s.position_x)
+        self._xs = [s.position_x for s in self._by_x]
+        self._silo_fire = tuple(s.fire for s in self.silos)
 
     def _init_silos(self) -> None:
         """Create the default 3 silos from configuration."""
@@ -119,11 +125,13 @@ class DefenseManager:
         - the silo cannot fire (empty / destroyed)
         - 8 ABMs are already active
         """
-        if current_active_abms >= MAX_ABM_SLOTS:
+        if current_active_abms >= MAX_ABM_SLOTS or silo_index < 0:
             return None
-        if silo_index < 0 or silo_index >= len(self.silos):
+        try:
+            fire = self._silo_fire[silo_index]
+        except IndexError:
             return None
-        return self.silos[silo_index].fire(target_x, target_y)
+        return fire(target_x, target_y)
 
     def fire_nearest(
         self,
@@ -134,22 +142,27 @@ class DefenseManager:
         """Fire from the nearest silo that has ammo.
 
         Useful for single-turret play style.  Returns None if no silo
-        can fire or the 8-ABM limit is reached.
+        can fire or the 8-ABM limit is reached.  Bisects the silos'
+        x positions and walks outward from the target, so the closest
+        silo is tried first; on a tie the left one wins.
         """
         if current_active_abms >= MAX_ABM_SLOTS:
             return None
-        best: Optional[DefenseSilo] = None
-        best_dist = float("inf")
-        for silo in self.silos:
-            if not silo.can_fire():
-                continue
-            d = abs(silo.position_x - target_x)
-            if d < best_dist:
-                best_dist = d
-                best = silo
-        if best is None:
-            return None
-        return best.fire(target_x, target_y)
+        by_x = self._by_x
+        xs = self._xs
+        hi = bisect_left(xs, target_x)
+        lo = hi - 1
+        n = len(xs)
+        while lo >= 0 or hi < n:
+            if hi >= n or (lo >= 0 and target_x - xs[lo] <= xs[hi] - target_x):
+                silo = by_x[lo]
+                lo -= 1
+            else:
+                silo = by_x[hi]
+                hi += 1
+            if silo.can_fire():
+                return silo.fire(target_x, target_y)
+        return None
 
     # Destruction ─────────────────────────────────────────────────────────
 
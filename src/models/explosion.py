@@ -37,6 +37,15 @@ class ExplosionState(Enum):
     DONE = auto()
 
 
+# Module-level aliases for Explosion.update(): ``state is _HOLDING`` is a
+# global load plus an identity test, where ``state == ExplosionState.HOLDING``
+# goes through Enum's class-attribute lookup on every comparison.
+_EXPANDING = ExplosionState.EXPANDING
+_HOLDING = ExplosionState.HOLDING
+_CONTRACTING = ExplosionState.CONTRACTING
+_DONE = ExplosionState.DONE
+
+
 # ── Octagon geometry ───────────────────────────────────────────────────────
 
 
@@ -90,19 +99,73 @@ def point_in_octagon(
     (h, radius) to (radius, h), i.e. dx + dy = h + radius = 2*radius - cut.
     """
     dx = abs(px - cx)
+    if dx > radius:
+        return False
     dy = abs(py - cy)
-    if dx > radius or dy > radius:
+    if dy > radius:
         return False
     cut = (radius * slope_num) // slope_den
-    if dx + dy > 2 * radius - cut:
-        return False
-    return True
+    return dx + dy <= 2 * radius - cut
+
+
+# ── Batched collision test ─────────────────────────────────────────────────
+
+
+def octagon_hit_indices(
+    exp_x: list[int], exp_y: list[int], exp_r: list[int],
+    targets: list[tuple[int, int, int]],
+) -> list[int]:
+    """Return the index (third field) of each *targets* row that lies
+    inside any of the given octagons, in *targets* order.
+
+    ``point_in_octagon`` over every (explosion, target) pair, with each
+    octagon's chamfer bound computed once.  Rows with a negative radius
+    never hit.
+    """
+    num = EXPLOSION_OCTAGON_SLOPE_NUM
+    den = EXPLOSION_OCTAGON_SLOPE_DEN
+    octagons = [
+        (cx, cy, r, 2 * r - (r * num) // den)
+        for cx, cy, r in zip(exp_x, exp_y, exp_r)
+    ]
+    hits: list[int] = []
+    for x, y, idx in targets:
+        for cx, cy, r, edge in octagons:
+            dx = abs(x - cx)
+            if dx > r:
+                continue
+            dy = abs(y - cy)
+            if dy <= r and dx + dy <= edge:
+                hits.append(idx)
+                break
+    return hits
+
+
+def broad_phase_targets(
+    exp_x: list[int], exp_y: list[int], exp_r: list[int],
+    targets: list[tuple[int, int, int]],
+) -> list[tuple[int, int, int]]:
+    """Return the *targets* rows inside the bounding box of all the
+    given octagons (rows with a negative radius are ignored) and at or
+    above EXPLOSION_COLLISION_ALTITUDE_MIN.
+
+    One pass over *targets* that leaves only the few near an explosion
+    for the per-octagon test.
+    """
+    boxes = [(cx, cy, r) for cx, cy, r in zip(exp_x, exp_y, exp_r) if r >= 0]
+    if not boxes:
+        return []
+    x0 = min(cx - r for cx, _, r in boxes)
+    x1 = max(cx + r for cx, _, r in boxes)
+    y0 = max(min(cy - r for _, cy, r in boxes), EXPLOSION_COLLISION_ALTITUDE_MIN)
+    y1 = max(cy + r for _, cy, r in boxes)
+    return [p for p in targets if x0 <= p[0] <= x1 and y0 <= p[1] <= y1]
 
 
 # ── Explosion ──────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class Explosion:
     """A single octagonal explosion.
 
@@ -133,38 +196,57 @@ class Explosion:
     state: ExplosionState = ExplosionState.EXPANDING
     frame_counter: int = 0
     is_active: bool = True
-
-    @property
-    def center_pos(self) -> tuple[int, int]:
-        return (self.center_x, self.center_y)
+    #: Vertices last returned by get_octagon_points() and the radius
+    #: they were built for. The radius only changes on this group's
+    #: update tick (and not at all while HOLDING), so most frames'
+    #: draws reuse the previous vertex tuple.
+    _vertex_cache: tuple[tuple[int, int], ...] = field(
+        default=(), init=False, repr=False, compare=False,
+    )
+    _cached_radius: int = field(default=-1, init=False, repr=False, compare=False)
+    #: Chamfer-edge bound (dx + dy limit) for the radius in
+    #: _edge_radius, recomputed by collides_with() only when the radius
+    #: has changed since the last check.
+    _edge: int = field(default=0, init=False, repr=False, compare=False)
+    _edge_radius: int = field(default=-1, init=False, repr=False, compare=False)
+    # Fixed for the explosion's lifetime; built once instead of per access.
+    center_pos: tuple[int, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.center_pos = (self.center_x, self.center_y)
 
     def update(self) -> None:
         """Advance one explosion tick (called when group is scheduled)."""
         if not self.is_active:
             return
 
-        if self.state == ExplosionState.EXPANDING:
+        state = self.state
+        if state is _EXPANDING:
             self.current_radius += self.expand_rate
             if self.current_radius >= self.max_radius:
                 self.current_radius = self.max_radius
-                self.state = ExplosionState.HOLDING
+                self.state = _HOLDING
                 self.frame_counter = 0
 
-        elif self.state == ExplosionState.HOLDING:
+        elif state is _HOLDING:
             self.frame_counter += 1
             if self.frame_counter >= self.hold_frames:
-                self.state = ExplosionState.CONTRACTING
+                self.state = _CONTRACTING
 
-        elif self.state == ExplosionState.CONTRACTING:
+        elif state is _CONTRACTING:
             self.current_radius -= self.contract_rate
             if self.current_radius <= 0:
                 self.current_radius = 0
-                self.state = ExplosionState.DONE
+                self.state = _DONE
                 self.is_active = False
 
-    def get_octagon_points(self) -> list[tuple[int, int]]:
+    def get_octagon_points(self) -> tuple[tuple[int, int], ...]:
         """Return the 8 vertices of the current octagon."""
-        return octagon_points(self.center_x, self.center_y, self.current_radius)
+        radius = self.current_radius
+        if radius != self._cached_radius:
+            self._vertex_cache = tuple(octagon_points(self.center_x, self.center_y, radius))
+            self._cached_radius = radius
+        return self._vertex_cache
 
     def collides_with(self, x: int, y: int) -> bool:
         """Return True if point (*x*, *y*) is inside the explosion.
@@ -172,32 +254,71 @@ class Explosion:
         No collision below altitude EXPLOSION_COLLISION_ALTITUDE_MIN
         (line 33).  Only used for ICBM collision testing.
         """
-        if not self.is_active or self.current_radius <= 0:
+        radius = self.current_radius
+        if not self.is_active or radius <= 0:
             return False
         if y < EXPLOSION_COLLISION_ALTITUDE_MIN:
             return False
-        return point_in_octagon(
-            x, y,
-            self.center_x, self.center_y,
-            self.current_radius,
-        )
+        # point_in_octagon, inlined with the edge bound cached per radius.
+        dx = abs(x - self.center_x)
+        if dx > radius:
+            return False
+        dy = abs(y - self.center_y)
+        if dy > radius:
+            return False
+        if radius != self._edge_radius:
+            cut = (radius * EXPLOSION_OCTAGON_SLOPE_NUM) // EXPLOSION_OCTAGON_SLOPE_DEN
+            self._edge = 2 * radius - cut
+            self._edge_radius = radius
+        return dx + dy <= self._edge
 
 
 # ── Explosion Manager (group scheduler) ───────────────────────────────────
 
 
-@dataclass
+_ALL_SLOTS_FREE = (1 << MAX_EXPLOSION_SLOTS) - 1
+_GROUP_BITS = (1 << EXPLOSIONS_PER_GROUP) - 1
+
+
+@dataclass(slots=True)
 class ExplosionManager:
     """Manages 20 explosion slots divided into 5 groups of 4.
 
     Only one group is updated per frame, cycling through groups 0-4.
     Collision detection for a group occurs when that group is updated.
+
+    Treat ``slots`` as read-only outside the manager: fill a slot with
+    ``add()`` and end an explosion early with ``finish()``, so the
+    free-slot mask and the cached centres stay in step with it.
     """
 
     slots: list[Optional[Explosion]] = field(
         default_factory=lambda: [None] * MAX_EXPLOSION_SLOTS,
     )
     current_group: int = 0  # 0-4, which group updates this frame
+    _last_group: int = field(default=0, init=False, repr=False, compare=False)
+    #: Bit i set <=> slots[i] is empty, built from ``slots`` in
+    #: __post_init__ and maintained by add()/update()/reset(). add()
+    #: takes the lowest set bit instead of scanning, and the clear bits
+    #: count the occupied slots.
+    _free_mask: int = field(
+        default=_ALL_SLOTS_FREE, init=False, repr=False, compare=False,
+    )
+    #: active_explosion_centers result, dropped whenever a slot is
+    #: filled or emptied (None = rebuild on next access).
+    _centers: Optional[tuple[tuple[int, int], ...]] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        # Same invariant as advance(): finished explosions don't hold
+        # a slot.
+        free = 0
+        for i, exp in enumerate(self.slots):
+            if exp is None or not exp.is_active:
+                self.slots[i] = None
+                free |= 1 << i
+        self._free_mask = free
 
     # Group helpers ───────────────────────────────────────────────────────
 
@@ -210,32 +331,82 @@ class ExplosionManager:
 
     def add(self, explosion: Explosion) -> bool:
         """Place *explosion* into a free slot.  Returns False if full."""
-        for i in range(MAX_EXPLOSION_SLOTS):
-            if self.slots[i] is None or not self.slots[i].is_active:
-                explosion.group_id = i // EXPLOSIONS_PER_GROUP
-                self.slots[i] = explosion
-                return True
-        return False
+        free = self._free_mask
+        if free:
+            lowest = free & -free
+            self._free_mask = free ^ lowest
+            i = lowest.bit_length() - 1
+        else:
+            # Every slot is occupied; an occupant can only be inactive
+            # if it was finished outside advance()/finish(), so this is
+            # rare.
+            for i, occupant in enumerate(self.slots):
+                if not occupant.is_active:
+                    break
+            else:
+                return False
+        explosion.group_id = i // EXPLOSIONS_PER_GROUP
+        self.slots[i] = explosion
+        self._centers = None
+        return True
+
+    def finish(self, index: int) -> None:
+        """End the explosion in slot *index* now and free the slot."""
+        exp = self.slots[index]
+        if exp is None:
+            return
+        exp.is_active = False
+        self.slots[index] = None
+        self._free_mask |= 1 << index
+        self._centers = None
 
     # Per-frame update ────────────────────────────────────────────────────
 
-    def update(self) -> list[Explosion]:
+    def advance(self) -> int:
         """Update the current group and advance the group counter.
 
-        Returns the list of active explosions in the updated group
-        (for collision testing by the caller).
+        Returns how many explosions in the updated group are still
+        active, without building a list of them; the caller reads the
+        group back through ``check_group_collisions``.
         """
-        updated: list[Explosion] = []
-        for i in self._group_indices(self.current_group):
-            exp = self.slots[i]
-            if exp is not None and exp.is_active:
+        group = self.current_group
+        self._last_group = group
+        self.current_group = (group + 1) % EXPLOSION_GROUPS
+        start = group * EXPLOSIONS_PER_GROUP
+        group_bits = _GROUP_BITS << start
+        if self._free_mask & group_bits == group_bits:
+            # Nothing in this group.
+            return 0
+
+        live = 0
+        slots = self.slots
+        for i in range(start, start + EXPLOSIONS_PER_GROUP):
+            exp = slots[i]
+            if exp is None:
+                continue
+            if exp.is_active:
                 exp.update()
-                updated.append(exp)
-            # Clean up finished explosions
-            if exp is not None and not exp.is_active:
-                self.slots[i] = None
-        self.current_group = (self.current_group + 1) % EXPLOSION_GROUPS
-        return updated
+                if exp.is_active:
+                    live += 1
+                    continue
+            # Finished (this tick or earlier): free the slot.
+            slots[i] = None
+            self._free_mask |= 1 << i
+            self._centers = None
+        return live
+
+    def update(self) -> list[Explosion]:
+        """``advance()``, returning the active explosions in the updated
+        group (for collision testing by the caller).
+        """
+        if not self.advance():
+            return []
+        # advance() empties finished slots, so every occupant is active.
+        start = self._last_group * EXPLOSIONS_PER_GROUP
+        return [
+            exp for exp in self.slots[start:start + EXPLOSIONS_PER_GROUP]
+            if exp is not None
+        ]
 
     # Collision helpers ───────────────────────────────────────────────────
 
@@ -248,30 +419,74 @@ class ExplosionManager:
 
         *icbm_positions* is a list of (x, y, slot_index) tuples.
         Collision is only tested when a group is drawn (every 5 frames).
+        Each hit index is reported once, in *icbm_positions* order.
         """
-        hit: list[int] = []
-        for ex in explosions:
-            for x, y, idx in icbm_positions:
-                if ex.collides_with(x, y):
-                    hit.append(idx)
-        return hit
+        live = [e for e in explosions if e.is_active and e.current_radius > 0]
+        if not live:
+            return []
+        exp_x = [e.center_x for e in live]
+        exp_y = [e.center_y for e in live]
+        exp_r = [e.current_radius for e in live]
+        targets = broad_phase_targets(exp_x, exp_y, exp_r, icbm_positions)
+        if not targets:
+            return []
+        return octagon_hit_indices(exp_x, exp_y, exp_r, targets)
+
+    def check_group_collisions(
+        self,
+        icbm_positions: list[tuple[int, int, int]],
+    ) -> list[int]:
+        """``check_icbm_collisions`` against the group the last
+        ``update()`` / ``advance()`` serviced, read from its slots.
+        """
+        start = self._last_group * EXPLOSIONS_PER_GROUP
+        group = [
+            e for e in self.slots[start:start + EXPLOSIONS_PER_GROUP]
+            if e is not None
+        ]
+        return self.check_icbm_collisions(group, icbm_positions)
+
+    def group_collides_with(self, x: int, y: int) -> bool:
+        """True if any explosion in the group the last ``update()`` /
+        ``advance()`` serviced contains point (*x*, *y*)."""
+        start = self._last_group * EXPLOSIONS_PER_GROUP
+        for exp in self.slots[start:start + EXPLOSIONS_PER_GROUP]:
+            if exp is not None and exp.collides_with(x, y):
+                return True
+        return False
 
     # Queries ─────────────────────────────────────────────────────────────
 
     @property
-    def active_explosion_centers(self) -> list[tuple[int, int]]:
-        """Return centre positions of all active explosions."""
-        return [
-            e.center_pos
-            for e in self.slots
-            if e is not None and e.is_active
-        ]
+    def active_explosion_centers(self) -> tuple[tuple[int, int], ...]:
+        """Return centre positions of all active explosions.
+
+        Rebuilt only when an explosion starts or finishes; the smart-bomb
+        evasion check reads it every frame in between.
+        """
+        centers = self._centers
+        if centers is None:
+            centers = self._centers = tuple(
+                e.center_pos
+                for e in self.slots
+                if e is not None and e.is_active
+            )
+        return centers
 
     @property
     def active_count(self) -> int:
-        return sum(1 for e in self.slots if e is not None and e.is_active)
+        """Number of active explosions.
+
+        Explosions only finish inside ``advance()`` or ``finish()``,
+        both of which empty the slot, so this is the occupied-slot
+        count read from the free-slot mask.
+        """
+        return MAX_EXPLOSION_SLOTS - self._free_mask.bit_count()
 
     def reset(self) -> None:
         """Clear all slots (wave reset)."""
         self.slots = [None] * MAX_EXPLOSION_SLOTS
         self.current_group = 0
+        self._last_group = 0
+        self._free_mask = _ALL_SLOTS_FREE
+        self._centers = None
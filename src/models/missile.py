@@ -14,7 +14,7 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Optional
+from typing import ClassVar, Optional, Sequence
 
 from src.config import (
     ABM_SPEED_CENTER,
@@ -61,7 +61,7 @@ def distance_approx(x1: int, y1: int, x2: int, y2: int) -> int:
     if dx < dy:
         dx, dy = dy, dx
     dist = dx + ((3 * dy) >> 3)
-    return min(dist, 255)
+    return dist if dist < 255 else 255
 
 
 def compute_increments(
@@ -78,8 +78,11 @@ def compute_increments(
         return (0, 0)
     dx = tx - sx
     dy = ty - sy
-    x_inc = (dx * speed * FIXED_POINT_SCALE) // dist
-    y_inc = (dy * speed * FIXED_POINT_SCALE) // dist
+    speed_fp = speed * FIXED_POINT_SCALE
+    # Axis-aligned shots (straight-down MIRV children, ABMs fired
+    # straight up) only need one division.
+    x_inc = (dx * speed_fp) // dist if dx else 0
+    y_inc = (dy * speed_fp) // dist if dy else 0
     return (x_inc, y_inc)
 
 
@@ -104,27 +107,15 @@ def has_passed_target(
     explosion and crater appeared at the target while the actual
     missile was still visibly airborne, nowhere near the ground.
     """
-    if x_inc > 0:
-        x_passed = cx >= tx
-    elif x_inc < 0:
-        x_passed = cx <= tx
-    else:
-        x_passed = True
-
-    if y_inc > 0:
-        y_passed = cy >= ty
-    elif y_inc < 0:
-        y_passed = cy <= ty
-    else:
-        y_passed = True
-
-    return x_passed and y_passed
+    # The offset past the target has the increment's sign once that
+    # axis is crossed; a zero increment makes the product 0 (passed).
+    return (cx - tx) * x_inc >= 0 and (cy - ty) * y_inc >= 0
 
 
 # ── ABM (Anti-Ballistic Missile – player) ──────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class ABM:
     """Player-fired Anti-Ballistic Missile.
 
@@ -149,8 +140,8 @@ class ABM:
 
     def __post_init__(self) -> None:
         speed = ABM_SPEED_CENTER if self.silo_index == 1 else ABM_SPEED_SIDE
-        self.current_x_fp = to_fixed(self.start_x)
-        self.current_y_fp = to_fixed(self.start_y)
+        self.current_x_fp = self.start_x << FIXED_POINT_SHIFT
+        self.current_y_fp = self.start_y << FIXED_POINT_SHIFT
         self.x_increment, self.y_increment = compute_increments(
             self.start_x, self.start_y,
             self.target_x, self.target_y,
@@ -160,27 +151,33 @@ class ABM:
     # Convenience integer properties ─────────────────────────────────────
     @property
     def current_x(self) -> int:
-        return from_fixed(self.current_x_fp)
+        return self.current_x_fp >> FIXED_POINT_SHIFT
 
     @property
     def current_y(self) -> int:
-        return from_fixed(self.current_y_fp)
+        return self.current_y_fp >> FIXED_POINT_SHIFT
 
     @property
     def current_pos(self) -> tuple[int, int]:
-        return (self.current_x, self.current_y)
+        return (
+            self.current_x_fp >> FIXED_POINT_SHIFT,
+            self.current_y_fp >> FIXED_POINT_SHIFT,
+        )
 
     # Update ──────────────────────────────────────────────────────────────
     def update(self) -> None:
         """Advance the ABM one frame along its trajectory."""
         if not self.is_active:
             return
-        self.current_x_fp += self.x_increment
-        self.current_y_fp += self.y_increment
+        x_inc = self.x_increment
+        y_inc = self.y_increment
+        x_fp = self.current_x_fp + x_inc
+        y_fp = self.current_y_fp + y_inc
+        self.current_x_fp = x_fp
+        self.current_y_fp = y_fp
         if has_passed_target(
-            self.current_x, self.current_y,
-            self.target_x, self.target_y,
-            self.x_increment, self.y_increment,
+            x_fp >> FIXED_POINT_SHIFT, y_fp >> FIXED_POINT_SHIFT,
+            self.target_x, self.target_y, x_inc, y_inc,
         ):
             self.is_active = False
 
@@ -190,8 +187,14 @@ class ABM:
 
 # ── ICBM (Incoming missile) ────────────────────────────────────────────────
 
+#: Values of the ``kind`` tag carried by every ICBM-table occupant, so
+#: per-type lookups (points, colors) index a tuple or compare an int
+#: instead of walking the MRO with isinstance().
+KIND_ICBM = 0
+KIND_SMART_BOMB = 1
+
 
-@dataclass
+@dataclass(slots=True)
 class ICBM:
     """Enemy Intercontinental Ballistic Missile.
 
@@ -206,6 +209,8 @@ class ICBM:
     - Unspent ICBMs remain for the wave
     """
 
+    kind: ClassVar[int] = KIND_ICBM
+
     entry_x: int
     entry_y: int
     target_x: int
@@ -237,8 +242,8 @@ class ICBM:
     intercepted: bool = False
 
     def __post_init__(self) -> None:
-        self.current_x_fp = to_fixed(self.entry_x)
-        self.current_y_fp = to_fixed(self.entry_y)
+        self.current_x_fp = self.entry_x << FIXED_POINT_SHIFT
+        self.current_y_fp = self.entry_y << FIXED_POINT_SHIFT
         self.x_increment, self.y_increment = compute_increments(
             self.entry_x, self.entry_y,
             self.target_x, self.target_y,
@@ -248,20 +253,23 @@ class ICBM:
 
     @property
     def current_x(self) -> int:
-        return from_fixed(self.current_x_fp)
+        return self.current_x_fp >> FIXED_POINT_SHIFT
 
     @property
     def current_y(self) -> int:
-        return from_fixed(self.current_y_fp)
+        return self.current_y_fp >> FIXED_POINT_SHIFT
 
     @property
     def altitude(self) -> int:
         """Altitude is the Y screen coordinate (top = 0)."""
-        return self.current_y
+        return self.current_y_fp >> FIXED_POINT_SHIFT
 
     @property
     def current_pos(self) -> tuple[int, int]:
-        return (self.current_x, self.current_y)
+        return (
+            self.current_x_fp >> FIXED_POINT_SHIFT,
+            self.current_y_fp >> FIXED_POINT_SHIFT,
+        )
 
     def update(self) -> None:
         """Advance the ICBM by one frame, respecting move_delay.
@@ -288,12 +296,15 @@ class ICBM:
     def _step(self) -> None:
         """Apply exactly one movement step (called once move_delay has
         elapsed)."""
-        self.current_x_fp += self.x_increment
-        self.current_y_fp += self.y_increment
+        x_inc = self.x_increment
+        y_inc = self.y_increment
+        x_fp = self.current_x_fp + x_inc
+        y_fp = self.current_y_fp + y_inc
+        self.current_x_fp = x_fp
+        self.current_y_fp = y_fp
         if has_passed_target(
-            self.current_x, self.current_y,
-            self.target_x, self.target_y,
-            self.x_increment, self.y_increment,
+            x_fp >> FIXED_POINT_SHIFT, y_fp >> FIXED_POINT_SHIFT,
+            self.target_x, self.target_y, x_inc, y_inc,
         ):
             self.is_active = False
 
@@ -382,7 +393,7 @@ class ICBM:
 # ── SmartBomb ───────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class SmartBomb(ICBM):
     """Smart bomb – extends ICBM with evasive movement.
 
@@ -395,15 +406,21 @@ class SmartBomb(ICBM):
     #4/#5.
     """
 
+    kind: ClassVar[int] = KIND_SMART_BOMB
+
     evasion_active: bool = False
-    nearby_explosions: list[tuple[int, int]] = field(default_factory=list)
+    nearby_explosions: Sequence[tuple[int, int]] = ()
 
     def detect_explosions(
-        self, explosion_centers: list[tuple[int, int]]
+        self, explosion_centers: Sequence[tuple[int, int]]
     ) -> None:
-        """Update the list of nearby explosion centres."""
-        self.nearby_explosions = list(explosion_centers)
-        self.evasion_active = len(self.nearby_explosions) > 0
+        """Update the nearby explosion centres.
+
+        Keeps a reference rather than a copy: the caller hands over a
+        freshly built list (or an immutable tuple) every frame.
+        """
+        self.nearby_explosions = explosion_centers
+        self.evasion_active = len(explosion_centers) > 0
 
     def update(self) -> None:
         """Advance one frame, applying evasion if needed.
@@ -428,41 +445,45 @@ class SmartBomb(ICBM):
     def _evade(self) -> None:
         """Table-driven evasion: move toward target without
         approaching the nearest explosion."""
-        # Compute normal increment toward target
-        dx_target = self.target_x - self.current_x
-        dy_target = self.target_y - self.current_y
-
-        # Find the closest explosion
-        closest = self.nearby_explosions[0]
-        best_dist = distance_approx(
-            self.current_x, self.current_y, closest[0], closest[1]
-        )
-        for ec in self.nearby_explosions[1:]:
-            d = distance_approx(
-                self.current_x, self.current_y, ec[0], ec[1]
-            )
+        cx = self.current_x_fp >> FIXED_POINT_SHIFT
+        cy = self.current_y_fp >> FIXED_POINT_SHIFT
+
+        # Find the closest explosion (distance_approx, inlined: this
+        # runs for every evading bomb on each of its move steps).
+        nearby = self.nearby_explosions
+        closest = nearby[0]
+        best_dist = 256
+        for ec in nearby:
+            dx = abs(ec[0] - cx)
+            dy = abs(ec[1] - cy)
+            d = dx + ((3 * dy) >> 3) if dx >= dy else dy + ((3 * dx) >> 3)
+            if d > 255:
+                d = 255
             if d < best_dist:
                 best_dist = d
                 closest = ec
 
-        dx_expl = closest[0] - self.current_x
-        dy_expl = closest[1] - self.current_y
+        dx_expl = closest[0] - cx
+        dy_expl = closest[1] - cy
 
         # Choose axis movement that does not reduce distance to explosion
         step_x = self.x_increment
         step_y = self.y_increment
 
-        # If moving in X would bring us closer to explosion, zero it
-        if dx_expl != 0 and (step_x > 0) == (dx_expl > 0):
+        # If moving along an axis would bring us closer to the
+        # explosion (step and offset share a sign), zero that step
+        if step_x * dx_expl > 0:
             step_x = 0
-        if dy_expl != 0 and (step_y > 0) == (dy_expl > 0):
+        if step_y * dy_expl > 0:
             step_y = 0
 
-        self.current_x_fp += step_x
-        self.current_y_fp += step_y
+        x_fp = self.current_x_fp + step_x
+        y_fp = self.current_y_fp + step_y
+        self.current_x_fp = x_fp
+        self.current_y_fp = y_fp
 
         if has_passed_target(
-            self.current_x, self.current_y,
+            x_fp >> FIXED_POINT_SHIFT, y_fp >> FIXED_POINT_SHIFT,
             self.target_x, self.target_y,
             self.x_increment, self.y_increment,
         ):
@@ -472,12 +493,16 @@ class SmartBomb(ICBM):
 # ── Flier (Bomber / Satellite) ─────────────────────────────────────────────
 
 
+#: Screen width in 8.8 fixed point, for the flier's per-frame step.
+_SCREEN_WIDTH_FP = SCREEN_WIDTH << FIXED_POINT_SHIFT
+
+
 class FlierType(Enum):
     BOMBER = auto()
     SATELLITE = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Flier:
     """Bomber or Satellite that crosses the screen horizontally.
 
@@ -502,7 +527,7 @@ class Flier:
     _x_fp: int = field(default=0, repr=False, init=False)
 
     def __post_init__(self) -> None:
-        self._x_fp = to_fixed(self.current_x)
+        self._x_fp = self.current_x << FIXED_POINT_SHIFT
 
     @staticmethod
     def create_random(
@@ -542,9 +567,9 @@ class Flier:
         """Advance by SCREEN_WIDTH / cross_frames pixels this frame."""
         if not self.is_active:
             return
-        step_fp = (to_fixed(SCREEN_WIDTH) // self.cross_frames) * self.direction
+        step_fp = (_SCREEN_WIDTH_FP // self.cross_frames) * self.direction
         self._x_fp += step_fp
-        self.current_x = from_fixed(self._x_fp)
+        self.current_x = self._x_fp >> FIXED_POINT_SHIFT
 
     def fire(
         self,
@@ -553,21 +578,21 @@ class Flier:
         move_delay: float = 0.0,
     ) -> list[ICBM]:
         """Fire missiles downward toward *targets*."""
-        missiles: list[ICBM] = []
         if not self.can_fire or not self.is_active:
-            return missiles
-        for t in targets:
-            missiles.append(
-                ICBM(
-                    entry_x=self.current_x,
-                    entry_y=self.altitude,
-                    target_x=t[0],
-                    target_y=t[1],
-                    speed=speed,
-                    move_delay=move_delay,
-                )
+            return []
+        entry_x = self.current_x
+        entry_y = self.altitude
+        return [
+            ICBM(
+                entry_x=entry_x,
+                entry_y=entry_y,
+                target_x=tx,
+                target_y=ty,
+                speed=speed,
+                move_delay=move_delay,
             )
-        return missiles
+            for tx, ty in targets
+        ]
 
     def deactivate(self) -> None:
         self.is_active = False
@@ -576,7 +601,12 @@ class Flier:
 # ── Slot Manager ────────────────────────────────────────────────────────────
 
 
-@dataclass
+#: Empty slot tables that reset() copies over the live lists in place.
+_NO_ABMS = (None,) * MAX_ABM_SLOTS
+_NO_ICBMS = (None,) * MAX_ICBM_SLOTS
+
+
+@dataclass(slots=True)
 class MissileSlotManager:
     """Manages the fixed-size slot tables for all missile types.
 
@@ -594,7 +624,11 @@ class MissileSlotManager:
 
     @property
     def active_abm_count(self) -> int:
-        return sum(1 for s in self.abm_slots if s is not None and s.is_active)
+        count = 0
+        for s in self.abm_slots:
+            if s is not None and s.is_active:
+                count += 1
+        return count
 
     def add_abm(self, abm: ABM) -> bool:
         """Try to place *abm* into a free slot.  Returns False if full."""
@@ -608,18 +642,23 @@ class MissileSlotManager:
 
     @property
     def active_icbm_count(self) -> int:
-        return sum(1 for s in self.icbm_slots if s is not None and s.is_active)
+        count = 0
+        for s in self.icbm_slots:
+            if s is not None and s.is_active:
+                count += 1
+        return count
 
     @property
     def smart_bomb_count(self) -> int:
-        return sum(
-            1 for s in self.icbm_slots
-            if isinstance(s, SmartBomb) and s.is_active
-        )
+        count = 0
+        for s in self.icbm_slots:
+            if s is not None and s.kind == KIND_SMART_BOMB and s.is_active:
+                count += 1
+        return count
 
     def add_icbm(self, icbm: ICBM) -> bool:
         """Try to place *icbm* into a free slot.  Returns False if full."""
-        if isinstance(icbm, SmartBomb) and self.smart_bomb_count >= MAX_SMART_BOMBS:
+        if icbm.kind == KIND_SMART_BOMB and self.smart_bomb_count >= MAX_SMART_BOMBS:
             return False
         for i, slot in enumerate(self.icbm_slots):
             if slot is None or not slot.is_active:
@@ -638,14 +677,18 @@ class MissileSlotManager:
     # Bulk operations ─────────────────────────────────────────────────────
 
     def update_all(self) -> None:
-        """Update every active missile / flier."""
+        """Update every active missile / flier.
+
+        Each update() already returns early for an inactive occupant,
+        so only empty slots are skipped here.
+        """
         for abm in self.abm_slots:
-            if abm is not None and abm.is_active:
+            if abm is not None:
                 abm.update()
         for icbm in self.icbm_slots:
-            if icbm is not None and icbm.is_active:
+            if icbm is not None:
                 icbm.update()
-        if self.flier_slot is not None and self.flier_slot.is_active:
+        if self.flier_slot is not None:
             self.flier_slot.update()
 
     def clear_inactive(self) -> None:
@@ -661,6 +704,6 @@ class MissileSlotManager:
 
     def reset(self) -> None:
         """Clear all slots (wave reset)."""
-        self.abm_slots = [None] * MAX_ABM_SLOTS
-        self.icbm_slots = [None] * MAX_ICBM_SLOTS
+        self.abm_slots[:] = _NO_ABMS
+        self.icbm_slots[:] = _NO_ICBMS
         self.flier_slot = None
@@ -10,6 +10,7 @@ back to silent operation when pygame.mixer or numpy is unavailable.
 from __future__ import annotations
 
 import os
+import sys
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Any, Optional
@@ -54,6 +55,24 @@ _SOUND_FILES: dict[SoundEvent, str] = {
     SoundEvent.SMART_BOMB_WARBLE: "smart_bomb.wav",
 }
 
+# SDL audio drivers probed when the default fails, in order.  The
+# silent dummy driver always works, so it is tried last and never
+# cached: a later launch must still find a real device.
+_FALLBACK_DRIVERS: tuple[str, ...] = ("pulseaudio", "alsa", "dsp")
+_SILENT_DRIVER = "dummy"
+
+
+def default_driver_cache_file() -> str:
+    """Per-user path for ``AudioManager.driver_cache_file``."""
+    home = os.path.expanduser("~")
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or home
+    elif sys.platform == "darwin":
+        base = os.path.join(home, "Library", "Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(home, ".cache")
+    return os.path.join(base, "missile-command", "sdl_audio_driver")
+
 
 @dataclass
 class AudioManager:
@@ -65,6 +84,11 @@ class AudioManager:
 
     sfx_dir: str = os.path.join("data", "sfx")
     enabled: bool = True
+    #: File remembering the fallback SDL audio driver that last
+    #: initialised the mixer, tried right after the default on the next
+    #: launch so machines where only that driver works skip the other
+    #: probes.  None disables it (see ``default_driver_cache_file``).
+    driver_cache_file: Optional[str] = None
 
     # Internal state
     _initialized: bool = field(default=False, repr=False)
@@ -78,7 +102,9 @@ class AudioManager:
 
         When running inside a Python virtual-environment the default SDL
         audio driver may not be detected.  We try several common drivers
-        before giving up.
+        before giving up; after the default, the first one tried is the
+        real driver cached in ``driver_cache_file`` by a previous run.
+        The silent ``dummy`` driver is never cached.
         """
         if not self.enabled:
             print("AudioManager: disabled via config")
@@ -92,7 +118,15 @@ class AudioManager:
                 print(f"AudioManager: mixer already initialized: {pygame.mixer.get_init()}")
                 self._initialized = True
             else:
-                drivers = [None, "pulseaudio", "alsa", "dsp", "dummy"]
+                # SDL's own choice first, then the real device driver a
+                # previous run needed (if any), then the rest of the
+                # probe; the silent dummy driver is always the last resort.
+                cached_driver = self._read_cached_driver()
+                drivers: list[Optional[str]] = [None]
+                if cached_driver is not None:
+                    drivers.append(cached_driver)
+                drivers += [d for d in _FALLBACK_DRIVERS if d != cached_driver]
+                drivers.append(_SILENT_DRIVER)
                 initialized = False
                 original_driver = os.environ.get("SDL_AUDIODRIVER")
 
@@ -110,6 +144,8 @@ class AudioManager:
                         print(f"AudioManager: SUCCESS with driver '{driver or 'default'}'")
                         print(f"AudioManager: mixer config: {pygame.mixer.get_init()}")
                         initialized = True
+                        if driver != cached_driver and driver != _SILENT_DRIVER:
+                            self._write_cached_driver(driver)
                         break
                     except Exception as e:
                         print(f"AudioManager: FAILED with driver '{driver or 'default'}': {e}")
@@ -139,6 +175,37 @@ class AudioManager:
         self._synthesize_missing_sounds()
         return True
 
+    def _read_cached_driver(self) -> Optional[str]:
+        """Return the real driver stored by a previous run, if any."""
+        if not self.driver_cache_file:
+            return None
+        try:
+            with open(self.driver_cache_file, "r", encoding="utf-8") as f:
+                name = f.read().strip()
+        except OSError:
+            return None
+        if name == _SILENT_DRIVER:
+            return None
+        return name or None
+
+    def _write_cached_driver(self, driver: Optional[str]) -> None:
+        """Remember ``driver`` for the next launch, or forget a stale
+        entry when the default driver worked; failures are ignored."""
+        if not self.driver_cache_file:
+            return
+        try:
+            if driver is None:
+                if os.path.exists(self.driver_cache_file):
+                    os.remove(self.driver_cache_file)
+                return
+            cache_dir = os.path.dirname(self.driver_cache_file)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            with open(self.driver_cache_file, "w", encoding="utf-8") as f:
+                f.write(driver + "\n")
+        except OSError as e:
+            print(f"AudioManager: could not cache driver name: {e}")
+
     def _load_sounds(self) -> None:
         """Attempt to load each configured sound file from disk."""
         if not self._initialized:
@@ -152,9 +219,15 @@ class AudioManager:
             return
 
         print(f"AudioManager: loading sounds from '{self.sfx_dir}'")
+        # One directory listing instead of an isfile() stat per sound.
+        try:
+            with os.scandir(self.sfx_dir) as entries:
+                present = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            present = set()
         for event, filename in _SOUND_FILES.items():
             path = os.path.join(self.sfx_dir, filename)
-            if os.path.isfile(path):
+            if filename in present:
                 try:
                     self._sounds[event] = pygame.mixer.Sound(path)
                     print(f"AudioManager: loaded {event.name} from {filename}")
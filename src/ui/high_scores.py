@@ -23,6 +23,8 @@ _DEFAULT_SCORES_FILE = "scores.json"
 
 def _normalize_score(value: object) -> int:
     """Convert a score value (int or padded string) to int."""
+    if type(value) is int:
+        return value
     return int(str(value).strip()) if value else 0
 
 
@@ -63,11 +65,10 @@ def save_high_scores(filepath: str, high_scores: dict) -> None:
 
 def check_high_score(score: int, high_scores: dict) -> int:
     """Return the 1-based position a *score* would occupy, or 0."""
-    score_pos = 0
     for pos, record in high_scores.items():
-        if score > _normalize_score(record["score"]) and score_pos == 0:
-            score_pos = int(pos)
-    return score_pos
+        if score > _normalize_score(record["score"]):
+            return int(pos)
+    return 0
 
 
 def update_high_scores(
@@ -81,13 +82,14 @@ def update_high_scores(
     score_pos = check_high_score(score, high_scores)
 
     if score_pos > 0:
-        max_pos = 10
-        for pos in range(max_pos, score_pos, -1):
-            if pos <= max_pos and pos > 1:
-                high_scores[str(pos)]["name"] = high_scores[str(pos - 1)]["name"]
-                high_scores[str(pos)]["score"] = high_scores[str(pos - 1)]["score"]
-        high_scores[str(score_pos)]["name"] = name
-        high_scores[str(score_pos)]["score"] = int(score)
+        # Records from the new rank down, and their entries shifted one
+        # rank lower with the new one on top (the old 10th falls off).
+        records = [high_scores[str(pos)] for pos in range(score_pos, 11)]
+        entries = [(name, int(score))]
+        entries += [(r["name"], r["score"]) for r in records[:-1]]
+        for record, (entry_name, entry_score) in zip(records, entries):
+            record["name"] = entry_name
+            record["score"] = entry_score
 
     return high_scores
 
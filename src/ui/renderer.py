@@ -30,7 +30,7 @@ from src.config import (
 )
 from src.game import Game, GameState
 from src.models.explosion import octagon_points
-from src.models.missile import Flier, SmartBomb
+from src.models.missile import KIND_SMART_BOMB, Flier
 from src.ui.palette import Palette, explosion_color, flash_color, get_palette
 
 NATIVE_SIZE = (SCREEN_WIDTH, SCREEN_HEIGHT)
@@ -39,6 +39,15 @@ FONT_PATH = os.path.join("data", "fnt", "PressStart2P-Regular.ttf")
 _font_cache: dict[int, pygame.font.Font] = {}
 
 
+def _to_display_format(surf: pygame.Surface) -> pygame.Surface:
+    """Convert a per-pixel-alpha surface to the display's format so
+    blitting it needs no per-call pixel conversion. A no-op before a
+    display mode exists (e.g. headless tests)."""
+    if pygame.display.get_surface() is None:
+        return surf
+    return surf.convert_alpha()
+
+
 def get_font(size: int) -> pygame.font.Font:
     """Return a cached font at *size*, falling back to the default font."""
     if size in _font_cache:
@@ -54,6 +63,32 @@ def get_font(size: int) -> pygame.font.Font:
     return font
 
 
+#: Rendered text surfaces keyed by (text, size, color). Most on-screen
+#: strings (titles, HUD labels, a score that changes a few times a
+#: second) repeat across many consecutive frames, so rasterising each
+#: one once saves a FreeType render + surface allocation per frame.
+_text_cache: dict[tuple[str, int, tuple[int, ...]], pygame.Surface] = {}
+_TEXT_CACHE_MAX = 256
+
+
+def render_text(text: str, size: int, color) -> pygame.Surface:
+    """Return an antialiased surface for *text*, cached across frames.
+
+    The returned surface is shared -- blit it, don't draw onto it.
+    """
+    key = (text, size, tuple(color))
+    surf = _text_cache.pop(key, None)
+    if surf is None:
+        if len(_text_cache) >= _TEXT_CACHE_MAX:
+            # Least-recently-used first: re-inserting on every hit keeps
+            # the per-frame labels at the young end, so a stream of
+            # one-off score strings can't evict them.
+            del _text_cache[next(iter(_text_cache))]
+        surf = _to_display_format(get_font(size).render(text, True, color))
+    _text_cache[key] = surf
+    return surf
+
+
 @dataclass
 class Renderer:
     """Owns the native render surface and the scaled application window."""
@@ -63,6 +98,16 @@ class Renderer:
 
     native: pygame.Surface = field(init=False, repr=False)
     window: Optional[pygame.Surface] = field(default=None, repr=False)
+    #: Set whenever the window is (re)created so the next present()
+    #: clears the pillarbox/letterbox bars once with a full flip;
+    #: every other frame only pushes the viewport rect to the display.
+    _needs_full_clear: bool = field(default=True, repr=False)
+    #: Window-space center, recomputed only when the window is
+    #: (re)created -- the app recenters the OS cursor here every frame.
+    window_center: tuple[int, int] = field(default=(0, 0), repr=False)
+    #: Cached static scenery layer and the state it was drawn for.
+    _scenery: Optional[pygame.Surface] = field(default=None, repr=False)
+    _scenery_key: Optional[tuple] = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
         self.native = pygame.Surface(NATIVE_SIZE)
@@ -72,11 +117,28 @@ class Renderer:
     def create_window(self) -> pygame.Surface:
         """Create (or recreate) the application window."""
         if self.fullscreen:
-            self.window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            # Let SDL's GPU renderer do the fullscreen upscale and
+            # letterboxing; fall back to the software upscale in
+            # present() where no hardware renderer is available.
+            try:
+                self.window = pygame.display.set_mode(
+                    NATIVE_SIZE, pygame.FULLSCREEN | pygame.SCALED,
+                )
+            except pygame.error:
+                self.window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
         else:
             size = (SCREEN_WIDTH * self.scale, SCREEN_HEIGHT * self.scale)
             self.window = pygame.display.set_mode(size)
         pygame.display.set_caption("Missile Command")
+        # Match the native surface to the display's pixel format so the
+        # per-frame upscale + blit in present() needs no conversion.
+        self.native = self.native.convert()
+        self._scenery = None
+        self._tally_row_sprites.clear()
+        self._ammo_sprites.clear()
+        self._needs_full_clear = True
+        win_w, win_h = self.window.get_size()
+        self.window_center = (win_w // 2, win_h // 2)
         return self.window
 
     def toggle_fullscreen(self) -> None:
@@ -126,14 +188,27 @@ class Renderer:
     # ── Present ───────────────────────────────────────────────────────────
 
     def present(self) -> None:
-        """Upscale the native surface onto the window and flip."""
+        """Upscale the native surface onto the window and push it to the display.
+
+        The bars around the viewport never change between window
+        (re)creations, so only the viewport rect is updated per frame;
+        the full-window fill + flip happens once after create_window().
+        """
         if self.window is None:
             return
         x_off, y_off, scaled_w, scaled_h = self._viewport()
-        scaled = pygame.transform.scale(self.native, (scaled_w, scaled_h))
-        self.window.fill((0, 0, 0))
-        self.window.blit(scaled, (x_off, y_off))
-        pygame.display.flip()
+        if (scaled_w, scaled_h) == NATIVE_SIZE:
+            scaled = self.native
+        else:
+            scaled = pygame.transform.scale(self.native, (scaled_w, scaled_h))
+        if self._needs_full_clear:
+            self.window.fill((0, 0, 0))
+            self.window.blit(scaled, (x_off, y_off))
+            pygame.display.flip()
+            self._needs_full_clear = False
+            return
+        dirty = self.window.blit(scaled, (x_off, y_off))
+        pygame.display.update(dirty)
 
     # ── Drawing ───────────────────────────────────────────────────────────
 
@@ -146,9 +221,7 @@ class Renderer:
     ) -> None:
         """Draw one full frame of gameplay onto the native surface."""
         palette = get_palette(game.wave_number)
-        self.native.fill(palette.sky)
-        self._draw_ground(game, palette)
-        self._draw_cities(game, palette)
+        self._draw_scenery(game, palette)
         self._draw_silos(game, palette)
         self._draw_missiles(game, palette)
         self._draw_explosions(game, frame_count)
@@ -158,6 +231,31 @@ class Renderer:
         if debug:
             self._draw_debug(game)
 
+    def _draw_scenery(self, game: Game, palette: Palette) -> None:
+        """Sky, ground, craters, silo mounds/wreckage and cities.
+
+        This layer only changes when a city or silo is destroyed or
+        restored, a crater appears, or the palette rotates -- so it is
+        drawn once per change, snapshotted, and otherwise restored
+        with a single full-surface blit instead of a fill plus dozens
+        of polygon draws.
+        """
+        key = (
+            palette,
+            tuple(game.ground_craters),
+            tuple(c.is_destroyed for c in game.cities.cities),
+            tuple(s.is_destroyed for s in game.defenses.silos),
+        )
+        if key == self._scenery_key and self._scenery is not None:
+            self.native.blit(self._scenery, (0, 0))
+            return
+        self.native.fill(palette.sky)
+        self._draw_ground(game, palette)
+        self._draw_cities(game, palette)
+        self._draw_silo_wreckage(game)
+        self._scenery = self.native.copy()
+        self._scenery_key = key
+
     #: City tuft cluster: a small, low, bushy cluster of spikes whose
     #: base sits exactly on the ground line. Kept narrow so the 6 cities
     #: fit cleanly between the 3 silo mounds without overlapping them.
@@ -239,56 +337,105 @@ class Renderer:
     _CITY_TALLY_ROW_Y = 108
     _CITY_TALLY_ROW_SPACING = 20
 
+    #: Pre-composited tally rows keyed by (total, revealed): the row only
+    #: changes when the roll-up reveals another city, so each frame of
+    #: the wave-end tally is one blit instead of a polygon per tuft.
+    #: Cleared by create_window() so the sprites match the display format.
+    _tally_row_sprites: dict[tuple[int, int], pygame.Surface] = field(
+        default_factory=dict, repr=False,
+    )
+
+    #: Baseline row within the cached band and the band height -- room
+    #: for the tallest tuft above and the placeholder dot below.
+    _TALLY_ROW_TOP = 9
+    _TALLY_ROW_HEIGHT = 12
+
     def draw_city_tally_row(self, total: int, revealed: int) -> None:
         """Draw a row of clean city icons across the screen, revealing
         them left-to-right one at a time as the wave-end tally counts up
         surviving cities (synced to the roll_up_2 tick sound)."""
         if total <= 0:
             return
+        key = (total, min(max(revealed, 0), total))
+        sprite = self._tally_row_sprites.get(key)
+        if sprite is None:
+            sprite = _to_display_format(self._build_tally_row(*key))
+            self._tally_row_sprites[key] = sprite
+        self.native.blit(sprite, (0, self._CITY_TALLY_ROW_Y - self._TALLY_ROW_TOP))
+
+    def _build_tally_row(self, total: int, revealed: int) -> pygame.Surface:
+        band = pygame.Surface((SCREEN_WIDTH, self._TALLY_ROW_HEIGHT), pygame.SRCALPHA)
+        y = self._TALLY_ROW_TOP
         spacing = self._CITY_TALLY_ROW_SPACING
         start_x = SCREEN_WIDTH // 2 - (spacing * (total - 1)) // 2
         for i in range(total):
             x = start_x + i * spacing
             if i < revealed:
                 self._draw_spiky_cluster(
-                    x, self._CITY_TALLY_ROW_Y, (255, 220, 0),
+                    x, y, (255, 220, 0),
                     self._CITY_TUFT_SPREAD, self._CITY_TUFT_HEIGHTS,
+                    surface=band,
                 )
             else:
-                pygame.draw.circle(self.native, (70, 70, 70), (x, self._CITY_TALLY_ROW_Y), 1)
+                pygame.draw.circle(band, (70, 70, 70), (x, y), 1)
+        return band
 
     def _draw_spiky_cluster(
         self, cx: int, base_y: int, color, spread: int, heights: tuple[int, ...],
+        surface: Optional[pygame.Surface] = None,
     ) -> None:
         """Draw a small cluster of jagged spikes (city rubble tufts)."""
+        if surface is None:
+            surface = self.native
         n = len(heights)
         start_x = cx - spread // 2
         step = max(1, spread // n)
         for i, h in enumerate(heights):
             x = start_x + i * step
             pygame.draw.polygon(
-                self.native, color,
+                surface, color,
                 [(x - 2, base_y), (x, base_y - h), (x + 2, base_y)],
             )
 
-    def _draw_silos(self, game: Game, palette: Palette) -> None:
+    def _draw_silo_wreckage(self, game: Game) -> None:
+        """Part of the static scenery layer (see _draw_scenery)."""
+        top_y = GROUND_Y - self._SILO_MOUND_HEIGHT
         for silo in game.defenses.silos:
-            x, _ = silo.position
-            top_y = GROUND_Y - self._SILO_MOUND_HEIGHT
-            if silo.is_destroyed:
-                # Mound is already darkened by _draw_silo_mound; mark the
-                # wreckage with a bright X so an empty-but-intact silo
-                # (0 ABMs left) is never confused with a destroyed one.
-                pygame.draw.line(
-                    self.native, (255, 255, 255),
-                    (x - 5, top_y - 4), (x + 5, top_y + 2), 1,
-                )
-                pygame.draw.line(
-                    self.native, (255, 255, 255),
-                    (x - 5, top_y + 2), (x + 5, top_y - 4), 1,
-                )
+            if not silo.is_destroyed:
                 continue
-            self._draw_ammo_rockets(x, top_y, silo.abm_count, palette)
+            x, _ = silo.position
+            # Mound is already darkened by _draw_silo_mound; mark the
+            # wreckage with a bright X so an empty-but-intact silo
+            # (0 ABMs left) is never confused with a destroyed one.
+            pygame.draw.line(
+                self.native, (255, 255, 255),
+                (x - 5, top_y - 4), (x + 5, top_y + 2), 1,
+            )
+            pygame.draw.line(
+                self.native, (255, 255, 255),
+                (x - 5, top_y + 2), (x + 5, top_y - 4), 1,
+            )
+
+    def _draw_silos(self, game: Game, palette: Palette) -> None:
+        """Ammo pyramids on intact silos (wreckage is in the scenery layer)."""
+        top_y = GROUND_Y - self._SILO_MOUND_HEIGHT
+        for silo in game.defenses.silos:
+            if not silo.is_destroyed:
+                self._draw_ammo_rockets(silo.position_x, top_y, silo.abm_count, palette)
+
+    #: Pre-rendered ammo pyramids keyed by (count, color): the silo
+    #: stock only changes when an ABM is fired, so each silo costs one
+    #: blit per frame instead of three line draws per remaining rocket.
+    #: Cleared by create_window() so the sprites match the display format.
+    _ammo_sprites: dict[tuple[int, tuple[int, ...]], pygame.Surface] = field(
+        default_factory=dict, repr=False,
+    )
+
+    #: Sprite-local position of the pyramid's (cx, top_y) anchor, and the
+    #: sprite size -- large enough for the 4-wide bottom row plus the
+    #: rocket bodies above and forked bases below each row.
+    _AMMO_SPRITE_ANCHOR = (8, 3)
+    _AMMO_SPRITE_SIZE = (17, 14)
 
     def _draw_ammo_rockets(self, cx: int, top_y: int, count: int, palette: Palette) -> None:
         """Draw remaining ABMs as a triangular pyramid of rocket icons
@@ -298,8 +445,18 @@ class Renderer:
         "LOW"/"OUT" HUD banner, not by recoloring the icons."""
         if count <= 0:
             return
-        color = palette.silo
         n = min(count, SILO_CAPACITY)
+        key = (n, tuple(palette.silo))
+        sprite = self._ammo_sprites.get(key)
+        if sprite is None:
+            sprite = _to_display_format(self._build_ammo_sprite(n, palette.silo))
+            self._ammo_sprites[key] = sprite
+        ax, ay = self._AMMO_SPRITE_ANCHOR
+        self.native.blit(sprite, (cx - ax, top_y - ay))
+
+    def _build_ammo_sprite(self, n: int, color) -> pygame.Surface:
+        sprite = pygame.Surface(self._AMMO_SPRITE_SIZE, pygame.SRCALPHA)
+        cx, top_y = self._AMMO_SPRITE_ANCHOR
         icon_spacing_x = 4
         row_spacing_y = 3
         drawn = 0
@@ -313,14 +470,16 @@ class Renderer:
                 if drawn >= n:
                     break
                 x = start_x + slot * icon_spacing_x
-                self._draw_rocket_icon(x, y, height=3, color=color)
+                self._draw_rocket_icon(sprite, x, y, height=3, color=color)
                 drawn += 1
+        return sprite
 
-    def _draw_rocket_icon(self, x: int, base_y: int, height: int, color) -> None:
+    @staticmethod
+    def _draw_rocket_icon(surface: pygame.Surface, x: int, base_y: int, height: int, color) -> None:
         """A tiny rocket silhouette: a short body with a small forked base."""
-        pygame.draw.line(self.native, color, (x, base_y), (x, base_y - height))
-        pygame.draw.line(self.native, color, (x, base_y), (x - 1, base_y + 1))
-        pygame.draw.line(self.native, color, (x, base_y), (x + 1, base_y + 1))
+        pygame.draw.line(surface, color, (x, base_y), (x, base_y - height))
+        pygame.draw.line(surface, color, (x, base_y), (x - 1, base_y + 1))
+        pygame.draw.line(surface, color, (x, base_y), (x + 1, base_y + 1))
 
     #: Bright green, verified distinct from every color in every wave
     #: palette (city/silo/abm_trail/icbm_trail) so smart bombs always
@@ -343,7 +502,7 @@ class Renderer:
             # PALETTES[2].icbm_trail (255, 210, 60) on waves 3/7/11/...,
             # making smart bombs indistinguishable from regular ICBMs.
             # Bright green doesn't appear in any wave palette's colors.
-            color = self._SMART_BOMB_COLOR if isinstance(missile, SmartBomb) else palette.icbm_trail
+            color = self._SMART_BOMB_COLOR if missile.kind == KIND_SMART_BOMB else palette.icbm_trail
             pygame.draw.line(
                 self.native, color,
                 (missile.entry_x, missile.entry_y), missile.current_pos,
@@ -384,13 +543,17 @@ class Renderer:
         pygame.draw.line(self.native, color, (x, y - 4), (x, y + 4))
 
     def _draw_hud(self, game: Game, palette: Palette) -> None:
-        font = get_font(7)
-        score_surf = font.render(game.score_display.format_score(), True, palette.text)
-        self.native.blit(score_surf, (4, 2))
-        high_surf = font.render(game.score_display.format_high_score(), True, palette.text)
-        self.native.blit(high_surf, (SCREEN_WIDTH - high_surf.get_width() - 4, 2))
-        wave_surf = font.render(f"WAVE {game.wave_number}", True, palette.text)
-        self.native.blit(wave_surf, (SCREEN_WIDTH // 2 - wave_surf.get_width() // 2, 2))
+        score_surf = render_text(game.score_display.format_score(), 7, palette.text)
+        high_surf = render_text(game.score_display.format_high_score(), 7, palette.text)
+        wave_surf = render_text(f"WAVE {game.wave_number}", 7, palette.text)
+        self.native.blits(
+            (
+                (score_surf, (4, 2)),
+                (high_surf, (SCREEN_WIDTH - high_surf.get_width() - 4, 2)),
+                (wave_surf, (SCREEN_WIDTH // 2 - wave_surf.get_width() // 2, 2)),
+            ),
+            doreturn=False,
+        )
         self._draw_ammo_status_banner(game, palette)
 
     def _draw_ammo_status_banner(self, game: Game, palette: Palette) -> None:
@@ -407,22 +570,23 @@ class Renderer:
             text = "LOW"
         else:
             return
-        surf = get_font(8).render(text, True, (60, 90, 230))
+        surf = render_text(text, 8, (60, 90, 230))
         self.native.blit(surf, (SCREEN_WIDTH // 2 - surf.get_width() // 2, GROUND_Y + 1))
 
     def _draw_debug(self, game: Game) -> None:
-        font = get_font(7)
         texts = [
             f"ABM {game.missiles.active_abm_count}/{MAX_ABM_SLOTS}",
             f"ICBM {game.missiles.active_icbm_count}/{MAX_ICBM_SLOTS}",
             f"EXP {game.explosions.active_count}",
             f"ICBMs left {game.icbms_remaining_this_wave}",
         ]
-        y = 14
-        for text in texts:
-            surf = font.render(text, True, (0, 255, 0))
-            self.native.blit(surf, (4, y))
-            y += 9
+        self.native.blits(
+            [
+                (render_text(text, 7, (0, 255, 0)), (4, 14 + 9 * i))
+                for i, text in enumerate(texts)
+            ],
+            doreturn=False,
+        )
 
     # ── Game over: "THE END" ──────────────────────────────────────────────
 
@@ -449,8 +613,7 @@ class Renderer:
         if radius > 0:
             pygame.draw.polygon(self.native, (235, 205, 40), octagon_points(cx, cy, radius))
         if radius >= max_radius * 0.5:
-            font = get_font(16)
-            surf = font.render("THE END", True, (200, 30, 30))
+            surf = render_text("THE END", 16, (200, 30, 30))
             x = cx - surf.get_width() // 2
             y = cy - surf.get_height() // 2
             self.native.blit(surf, (x, y))
@@ -7,28 +7,45 @@ interface.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreDisplay:
     """Tracks and formats the player score and high-score for HUD display."""
 
     player_score: int = 0
     high_score: int = 0
+    #: Last strings built by format_score()/format_high_score() and the
+    #: values they show. The HUD asks every frame but the numbers only
+    #: change on a hit; keying on the value (rather than invalidating in
+    #: add()) also covers high_score being assigned directly.
+    _score_text: str = field(default="", init=False, repr=False, compare=False)
+    _score_text_for: int = field(default=-1, init=False, repr=False, compare=False)
+    _high_text: str = field(default="", init=False, repr=False, compare=False)
+    _high_text_for: int = field(default=-1, init=False, repr=False, compare=False)
 
     def add(self, points: int) -> None:
         """Add *points* to the player score and update high score."""
-        self.player_score += points
-        if self.player_score > self.high_score:
-            self.high_score = self.player_score
+        score = self.player_score + points
+        self.player_score = score
+        if score > self.high_score:
+            self.high_score = score
 
     def reset(self) -> None:
         """Reset player score (high score persists)."""
         self.player_score = 0
 
     def format_score(self) -> str:
-        return f"SCORE: {self.player_score}"
+        score = self.player_score
+        if score != self._score_text_for:
+            self._score_text = f"SCORE: {score}"
+            self._score_text_for = score
+        return self._score_text
 
     def format_high_score(self) -> str:
-        return f"HIGH: {self.high_score}"
+        score = self.high_score
+        if score != self._high_text_for:
+            self._high_text = f"HIGH: {score}"
+            self._high_text_for = score
+        return self._high_text
@@ -11,6 +11,8 @@ References:
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from src.config import (
     ATTACK_PACE_BASE,
     ATTACK_PACE_FACTOR,
@@ -47,12 +49,15 @@ def distance_approx(x1: int, y1: int, x2: int, y2: int) -> int:
     if dx < dy:
         dx, dy = dy, dx
     dist = dx + ((3 * dy) >> 3)
-    return min(dist, 255)
+    return dist if dist < 255 else 255
 
 
 # ── Wave helpers ────────────────────────────────────────────────────────────
+# Pure functions of small ints, memoized: each wave only ever asks for
+# a handful of distinct arguments.
 
 
+@lru_cache(maxsize=None)
 def get_wave_move_delay(wave_number: int) -> float:
     """Return the ICBM move-delay (frames waited between steps) for a wave.
 
@@ -64,13 +69,24 @@ def get_wave_move_delay(wave_number: int) -> float:
     return ICBM_MOVE_DELAY_TABLE[max(idx, 0)]
 
 
+def _attack_pace_altitude(wave_number: int) -> int:
+    alt = ATTACK_PACE_BASE - ATTACK_PACE_FACTOR * wave_number
+    return max(alt, ATTACK_PACE_MIN)
+
+
+#: get_attack_pace_altitude() for waves 0-127, read by the spawner
+#: every frame.
+_ATTACK_PACE_ALTITUDES = tuple(_attack_pace_altitude(w) for w in range(128))
+
+
 def get_attack_pace_altitude(wave_number: int) -> int:
     """Return the attack-pacing altitude for a given wave.
 
     Formula: 202 - 2 * wave_number, minimum 180.
     """
-    alt = ATTACK_PACE_BASE - ATTACK_PACE_FACTOR * wave_number
-    return max(alt, ATTACK_PACE_MIN)
+    if 0 <= wave_number < 128:
+        return _ATTACK_PACE_ALTITUDES[wave_number]
+    return _attack_pace_altitude(wave_number)
 
 
 def get_icbm_count_for_wave(wave_number: int) -> int:
@@ -79,6 +95,7 @@ def get_icbm_count_for_wave(wave_number: int) -> int:
     return ICBM_COUNT_TABLE[idx]
 
 
+@lru_cache(maxsize=None)
 def get_flier_wave_params(wave_number: int) -> tuple[int, int, tuple[int, int]]:
     """Return (cooldown_frames, fire_rate_frames, altitude_range) for a wave.
 
@@ -103,6 +120,7 @@ def get_score_multiplier(wave_number: int) -> int:
     return min((max(wave_number, 1) + 1) // 2, 6)
 
 
+@lru_cache(maxsize=None)
 def calculate_wave_bonus(
     surviving_cities: int,
     remaining_abms: int,
@@ -7,11 +7,15 @@ Maps player input events to game actions (silo selection, firing, etc.).
 from __future__ import annotations
 
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import IntEnum, auto
 
 
-class GameAction(Enum):
-    """Actions the player can trigger."""
+class GameAction(IntEnum):
+    """Actions the player can trigger.
+
+    An IntEnum so comparisons take the int fast path, and a handler
+    table can be indexed by action directly (values run 1..N).
+    """
     FIRE_LEFT = auto()
     FIRE_CENTER = auto()
     FIRE_RIGHT = auto()
@@ -21,7 +25,7 @@ class GameAction(Enum):
     NONE = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class InputEvent:
     """Abstract input event consumed by the game loop."""
     action: GameAction
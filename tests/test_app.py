@@ -16,13 +16,15 @@ from src.app import (
     TALLY_PHASE_PAUSE_FRAMES,
 )
 from src.config import (
+    CROSSHAIR_SENSITIVITY,
     GAME_OVER_DISPLAY_FRAMES,
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
+    SILO_POSITIONS,
     WAVE_END_DISPLAY_FRAMES,
     WAVE_INTRO_DISPLAY_FRAMES,
 )
-from src.game import GameState
+from src.game import Game, GameState
 
 
 # ── Argument parsing ───────────────────────────────────────────────────────
@@ -41,43 +43,31 @@ class TestParseArgs:
         assert args.cities == 6
         assert args.bonus_interval == 10000
 
-    def test_fullscreen_flag(self):
-        args = parse_args(["--fullscreen"])
-        assert args.fullscreen is True
-
-    def test_scale_multiplier(self):
-        for n in range(1, 5):
-            args = parse_args(["--scale", str(n)])
-            assert args.scale == n
+    @pytest.mark.parametrize("argv, attr, expected", [
+        (["--fullscreen"], "fullscreen", True),
+        (["--debug"], "debug", True),
+        (["--attract"], "attract", True),
+        (["--wave", "5"], "wave", 5),
+        (["--tournament"], "tournament", True),
+        (["--mute"], "mute", True),
+    ])
+    def test_flag(self, argv, attr, expected):
+        value = getattr(parse_args(argv), attr)
+        assert type(value) is type(expected)
+        assert value == expected
+
+    @pytest.mark.parametrize("n", [1, 2, 3, 4])
+    def test_scale_multiplier(self, n):
+        assert parse_args(["--scale", str(n)]).scale == n
 
     def test_invalid_scale_rejected(self):
         with pytest.raises(SystemExit):
             parse_args(["--scale", "5"])
 
-    def test_debug_flag(self):
-        args = parse_args(["--debug"])
-        assert args.debug is True
-
-    def test_attract_flag(self):
-        args = parse_args(["--attract"])
-        assert args.attract is True
-
-    def test_wave_number(self):
-        args = parse_args(["--wave", "5"])
-        assert args.wave == 5
-
-    def test_tournament_mode(self):
-        args = parse_args(["--tournament"])
-        assert args.tournament is True
-
     def test_marathon_tournament_mutually_exclusive(self):
         with pytest.raises(SystemExit):
             parse_args(["--marathon", "--tournament"])
 
-    def test_mute_flag(self):
-        args = parse_args(["--mute"])
-        assert args.mute is True
-
     def test_cities_option(self):
         for n in range(4, 8):
             args = parse_args(["--cities", str(n)])
@@ -143,6 +133,20 @@ class TestMissileCommandApp:
     def test_irq_per_frame(self):
         assert IRQ_PER_FRAME == 4
 
+    def test_wait_for_next_frame_sleeps_for_the_rest_of_the_frame(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr("time.perf_counter", lambda: 10.005)
+        monkeypatch.setattr("time.sleep", sleeps.append)
+        MissileCommandApp._wait_for_next_frame(10.0)
+        assert sleeps == [pytest.approx(FRAME_TIME - 0.005)]
+
+    def test_wait_for_next_frame_skips_sleep_on_overrun(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr("time.perf_counter", lambda: 10.0 + 2 * FRAME_TIME)
+        monkeypatch.setattr("time.sleep", sleeps.append)
+        MissileCommandApp._wait_for_next_frame(10.0)
+        assert sleeps == []
+
     def test_irq_simulation(self):
         app = MissileCommandApp()
         app.running = True
@@ -159,6 +163,21 @@ class TestMissileCommandApp:
         # Actually: 7+1=8→reset to 0, 0+1=1, 1+1=2, 2+1=3
         assert app.color_cycle_counter == 3
 
+    def test_frame_time_window_is_bounded(self):
+        app = MissileCommandApp()
+        for _ in range(100):
+            app._record_frame_time(0.02)
+        assert len(app.frame_times) == 60
+        assert app.fps == pytest.approx(50.0)
+
+    def test_fps_tracks_rolling_average(self):
+        app = MissileCommandApp()
+        for _ in range(60):
+            app._record_frame_time(0.02)
+        for _ in range(60):
+            app._record_frame_time(0.01)
+        assert app.fps == pytest.approx(100.0)
+
     def test_defer_score_redraw_default(self):
         app = MissileCommandApp()
         assert app.defer_score_redraw is False
@@ -175,22 +194,11 @@ class TestMissileCommandApp:
 class TestSiloFiring:
     """Tests that the app correctly maps silo indices to game.fire_from_silo."""
 
-    def test_fire_silo_left(self):
-        app = MissileCommandApp()
-        app.game.start_wave()
-        app._fire_silo(0)
-        assert app.game.missiles.active_abm_count == 1
-
-    def test_fire_silo_center(self):
-        app = MissileCommandApp()
-        app.game.start_wave()
-        app._fire_silo(1)
-        assert app.game.missiles.active_abm_count == 1
-
-    def test_fire_silo_right(self):
+    @pytest.mark.parametrize("silo_index", [0, 1, 2])  # left, center, right
+    def test_fire_silo(self, silo_index):
         app = MissileCommandApp()
         app.game.start_wave()
-        app._fire_silo(2)
+        app._fire_silo(silo_index)
         assert app.game.missiles.active_abm_count == 1
 
     def test_fire_silo_noop_in_attract_mode(self):
@@ -226,8 +234,9 @@ class TestMouseButtonSiloMapping:
         pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=button, pos=(0, 0)))
         app._handle_events()
 
-    def test_left_click_fires_left_silo(self):
+    def test_left_click_fires_left_silo(self, tmp_path):
         app = MissileCommandApp()
+        app.audio.driver_cache_file = str(tmp_path / "sdl_audio_driver")
         app.init()
         app.game.start_wave()
         self._fire_via_mouse_button(app, 1)
@@ -235,8 +244,9 @@ class TestMouseButtonSiloMapping:
         assert abm.silo_index == 0
         app.shutdown()
 
-    def test_middle_click_fires_center_silo(self):
+    def test_middle_click_fires_center_silo(self, tmp_path):
         app = MissileCommandApp()
+        app.audio.driver_cache_file = str(tmp_path / "sdl_audio_driver")
         app.init()
         app.game.start_wave()
         self._fire_via_mouse_button(app, 2)
@@ -244,8 +254,9 @@ class TestMouseButtonSiloMapping:
         assert abm.silo_index == 1
         app.shutdown()
 
-    def test_right_click_fires_right_silo(self):
+    def test_right_click_fires_right_silo(self, tmp_path):
         app = MissileCommandApp()
+        app.audio.driver_cache_file = str(tmp_path / "sdl_audio_driver")
         app.init()
         app.game.start_wave()
         self._fire_via_mouse_button(app, 3)
@@ -253,31 +264,49 @@ class TestMouseButtonSiloMapping:
         assert abm.silo_index == 2
         app.shutdown()
 
+    def test_click_between_motions_fires_where_the_crosshair_was(self, tmp_path):
+        """Events are handled in queue order: motion queued after a click
+        moves the crosshair but not that click's target."""
+        app = MissileCommandApp()
+        app.audio.driver_cache_file = str(tmp_path / "sdl_audio_driver")
+        app.init()
+        pygame.event.clear()
+        app.game.start_wave()
+        app.crosshair_x = 80
+        rel = int(60 * max(app.renderer.effective_scale, 1) / CROSSHAIR_SENSITIVITY)
+        for event in (
+            pygame.event.Event(pygame.MOUSEMOTION, pos=(300, 300),
+                               rel=(rel, 0), buttons=(0, 0, 0)),
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=2, pos=(0, 0)),
+            pygame.event.Event(pygame.MOUSEMOTION, pos=(300, 300),
+                               rel=(-rel, 0), buttons=(0, 0, 0)),
+        ):
+            pygame.event.post(event)
+        app._handle_events()
+        abm = next(s for s in app.game.missiles.abm_slots if s is not None)
+        assert abm.target_x == 140
+        assert app.crosshair_x == pytest.approx(80)
+        app.shutdown()
+
 
 class TestThreeSiloConfig:
     """Tests that the src model always initializes 3 silos."""
 
     def test_game_has_three_silos(self):
-        from src.game import Game
         game = Game()
         assert len(game.defenses.silos) == 3
 
-    def test_silos_at_correct_positions(self):
-        from src.config import SILO_POSITIONS
-        from src.game import Game
+    @pytest.mark.parametrize("silo_index", [0, 1, 2])  # left, center, right
+    def test_silo_at_correct_position(self, silo_index):
         game = Game()
-        assert game.defenses.silos[0].position_x == SILO_POSITIONS[0][0]  # left
-        assert game.defenses.silos[1].position_x == SILO_POSITIONS[1][0]  # center
-        assert game.defenses.silos[2].position_x == SILO_POSITIONS[2][0]  # right
+        assert game.defenses.silos[silo_index].position_x == SILO_POSITIONS[silo_index][0]
 
-    def test_each_silo_starts_with_10_abms(self):
-        from src.game import Game
+    @pytest.mark.parametrize("silo_index", [0, 1, 2])
+    def test_silo_starts_with_10_abms(self, silo_index):
         game = Game()
-        for silo in game.defenses.silos:
-            assert silo.abm_count == 10
+        assert game.defenses.silos[silo_index].abm_count == 10
 
     def test_fire_from_each_silo(self):
-        from src.game import Game
         game = Game()
         game.start_wave()
         assert game.fire_from_silo(0, 100, 50) is True  # left
@@ -524,11 +553,13 @@ class TestInitialsEntry:
 
     def _make_initialized_app(self, tmp_path):
         """A pygame.event.post-capable app: init() must run with
-        scores_file already pointed at the tmp path, since init()
-        itself calls load_scores(self.scores_file) -- otherwise it
-        would touch the real project scores.json."""
+        scores_file and the audio driver cache already pointed at the
+        tmp path, since init() reads the one and may write the other --
+        otherwise it would touch the real project scores.json and the
+        user's cache directory."""
         app = MissileCommandApp()
         app.scores_file = str(tmp_path / "scores.json")
+        app.audio.driver_cache_file = str(tmp_path / "sdl_audio_driver")
         assert app.init()
         # Window creation queues its own stray MOUSEMOTION (e.g. cursor
         # entering the window) that would otherwise get processed
@@ -630,3 +661,66 @@ class TestInitialsEntry:
         app._handle_events()
         assert app.crosshair_x != before
         app.shutdown()
+
+    def test_initials_screen_only_redraws_on_change(self, tmp_path):
+        app = self._make_initialized_app(tmp_path)
+        app._update()
+        presents = []
+        app.renderer.present = lambda: presents.append(1)
+        app._render()
+        app._render()
+        assert len(presents) == 1
+        self._press_key(app, pygame.K_RIGHT)
+        app._render()
+        assert len(presents) == 2
+        app.shutdown()
+
+    def test_escape_quits_from_any_screen(self, tmp_path):
+        app = self._make_initialized_app(tmp_path)
+        assert app._awaiting_initials
+        self._press_key(app, pygame.K_ESCAPE)
+        assert app.running is False
+        app.shutdown()
+
+    def test_unused_event_types_are_blocked(self, tmp_path):
+        app = self._make_initialized_app(tmp_path)
+        assert pygame.event.get_blocked(pygame.JOYAXISMOTION)
+        assert pygame.event.get_blocked(pygame.TEXTINPUT)
+        assert not pygame.event.get_blocked(pygame.KEYDOWN)
+        assert not pygame.event.get_blocked(pygame.MOUSEMOTION)
+        app.shutdown()
+
+    def test_queued_mouse_motion_is_coalesced(self, tmp_path):
+        """Consecutive motion reports in one frame move the crosshair by
+        their combined relative distance in a single step."""
+        app = self._make_initialized_app(tmp_path)
+        app._awaiting_initials = False
+        app.crosshair_x = 100
+        for _ in range(3):
+            pygame.event.post(pygame.event.Event(
+                pygame.MOUSEMOTION, pos=(300, 300), rel=(10, 0), buttons=(0, 0, 0),
+            ))
+        app._handle_events()
+        scale = max(app.renderer.effective_scale, 1)
+        assert app.crosshair_x == pytest.approx(100 + 30 * CROSSHAIR_SENSITIVITY / scale)
+        app.shutdown()
+
+    def test_motion_after_a_click_moves_the_next_slot(self, tmp_path):
+        """Coalescing only merges *consecutive* motion: motion queued
+        after the click that confirms slot 0 scrubs slot 1, not slot 0."""
+        app = self._make_initialized_app(tmp_path)
+        app._initials[:] = ["A", "A", "A"]
+        app.crosshair_x = 0
+        rel = int(SCREEN_WIDTH * 0.9 * max(app.renderer.effective_scale, 1)
+                  / CROSSHAIR_SENSITIVITY)
+        for event in (
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(0, 0)),
+            pygame.event.Event(pygame.MOUSEMOTION, pos=(300, 300),
+                               rel=(rel, 0), buttons=(0, 0, 0)),
+        ):
+            pygame.event.post(event)
+        app._handle_events()
+        assert app._initials_slot == 1
+        assert app._initials[0] == "A"
+        assert app._initials[1] != "A"
+        app.shutdown()
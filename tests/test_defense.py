@@ -4,6 +4,8 @@ Tests for defense silo and city functionality.
 Covers DefenseSilo, DefenseManager, City, CityManager, and bonus city logic.
 """
 
+import random
+
 import pytest
 
 from src.config import (
@@ -79,10 +81,40 @@ class TestDefenseSiloUnit:
         assert abm is not None
         assert abm.silo_index == 0  # left silo nearest to x=40
 
+    def test_fire_nearest_matches_linear_scan(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            mgr = DefenseManager()
+            for silo in mgr.silos:
+                silo.is_destroyed = rng.random() < 0.3
+                silo.abm_count = rng.choice([0, 1, 5])
+            target_x = rng.randint(0, 409)
+            firing = [s for s in mgr.silos if s.can_fire()]
+            expected = min(
+                firing, key=lambda s: abs(s.position_x - target_x), default=None,
+            )
+            abm = mgr.fire_nearest(target_x, 50, 0)
+            if expected is None:
+                assert abm is None
+            else:
+                assert abm.silo_index == expected.silo_index
+
     def test_total_abm_count(self):
         mgr = DefenseManager()
         assert mgr.total_abm_count == SILO_CAPACITY * 3
 
+    def test_total_abm_count_tracks_fired_abms(self):
+        mgr = DefenseManager()
+        mgr.fire(0, 100, 50, 0)
+        mgr.fire(2, 100, 50, 0)
+        assert mgr.total_abm_count == SILO_CAPACITY * 3 - 2
+
+    def test_silo_uses_slots(self):
+        silo = DefenseSilo(silo_index=0, position_x=32, position_y=220)
+        assert not hasattr(silo, "__dict__")
+        with pytest.raises(AttributeError):
+            silo.gun_end = (0, 0)
+
 
 # ── City Tests ──────────────────────────────────────────────────────────────
 
@@ -153,12 +185,47 @@ class TestCityUnit:
         mgr = CityManager()
         assert mgr.destroy_city_at(-1000, -1000) is False
 
+    def test_destroy_city_at_skips_destroyed_city(self):
+        mgr = CityManager()
+        x, y = mgr.cities[0].position
+        mgr.cities[0].destroy()
+        assert mgr.destroy_city_at(x, y) is False
+
+    def test_destroy_city_at_after_restore(self):
+        mgr = CityManager()
+        x, y = mgr.cities[0].position
+        assert mgr.destroy_city_at(x, y) is True
+        mgr.cities[0].restore()
+        assert mgr.destroy_city_at(x, y) is True
+        assert mgr.active_count == 5
+
+    def test_active_count_ignores_repeated_destroy_and_restore(self):
+        mgr = CityManager()
+        mgr.cities[0].destroy()
+        mgr.cities[0].destroy()
+        assert mgr.active_count == 5
+        mgr.cities[0].restore()
+        mgr.cities[0].restore()
+        assert mgr.active_count == 6
+
     def test_replace_random_crater_no_bonus_cities(self):
         mgr = CityManager()
         mgr.destroy_city(0)
         assert mgr.bonus_cities == 0
         assert mgr.replace_random_crater() is False
 
+    def test_replace_random_crater_picks_uniformly_among_craters(self):
+        mgr = CityManager()
+        for i in (1, 3, 4):
+            mgr.destroy_city(i)
+        random.seed(7)
+        expected = random.choice([1, 3, 4])
+        random.seed(7)
+        mgr.bonus_cities = 1
+        assert mgr.replace_random_crater() is True
+        assert not mgr.cities[expected].is_destroyed
+        assert mgr.active_count == 4
+
     def test_replace_random_crater_no_craters(self):
         mgr = CityManager()
         mgr.bonus_cities = 1
@@ -197,6 +264,20 @@ class TestBonusCityUnit:
         mgr.check_bonus(256)
         assert mgr.bonus_cities == 0  # 256 & 0xFF == 0
 
+    def test_remainder_carries_to_next_check(self):
+        mgr = CityManager()
+        mgr.bonus_threshold = 1000
+        assert mgr.check_bonus(2500) == 2
+        assert mgr.check_bonus(2999) == 0
+        assert mgr.check_bonus(3000) == 1
+        assert mgr.bonus_cities == 3
+
+    def test_huge_score_awards_without_iterating(self):
+        mgr = CityManager()
+        mgr.bonus_threshold = 1
+        assert mgr.check_bonus(10**12) == 10**12
+        assert mgr.bonus_cities == 10**12 & 0xFF
+
     def test_total_includes_bonus(self):
         mgr = CityManager()
         mgr.bonus_cities = 5
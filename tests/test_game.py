@@ -171,6 +171,21 @@ class TestWaveManagement:
                 break
         assert game.score_display.player_score == POINTS_PER_ICBM * 3
 
+    def test_collision_check_skipped_when_no_group_updated(self, monkeypatch):
+        game = Game()
+        game.start_wave()
+        game.icbms_remaining_this_wave = 0
+        game.missiles.icbm_slots[0] = ICBM(
+            entry_x=100, entry_y=100, target_x=100, target_y=220, speed=1,
+        )
+        calls = []
+        monkeypatch.setattr(
+            ExplosionManager, "check_group_collisions",
+            lambda *args: calls.append(args) or [],
+        )
+        game.update()
+        assert calls == []
+
 
 # ── Slot Management Tests ──────────────────────────────────────────────────
 
@@ -223,6 +238,17 @@ class TestSlotManagement:
                        target_x=128, target_y=50)
         assert mgr.add_abm(new_abm) is True
 
+    def test_reset_empties_slot_tables_in_place(self):
+        mgr = MissileSlotManager()
+        abm_slots, icbm_slots = mgr.abm_slots, mgr.icbm_slots
+        mgr.add_abm(ABM(silo_index=1, start_x=128, start_y=220,
+                        target_x=128, target_y=50))
+        mgr.add_icbm(ICBM(entry_x=0, entry_y=0, target_x=128, target_y=200))
+        mgr.reset()
+        assert mgr.abm_slots is abm_slots and mgr.icbm_slots is icbm_slots
+        assert abm_slots == [None] * MAX_ABM_SLOTS
+        assert icbm_slots == [None] * MAX_ICBM_SLOTS
+
 
 # ── Explosion Tests ─────────────────────────────────────────────────────────
 
@@ -24,6 +24,8 @@ from __future__ import annotations
 
 import random
 
+import pytest
+
 from src.config import (
     MAX_ABM_SLOTS,
     MAX_ICBM_SLOTS,
@@ -96,6 +98,7 @@ class TestHeadlessSimulation:
         # defense regression, e.g. fire_nearest silently broken).
         assert game.score_display.player_score > 0
 
+    @pytest.mark.slow
     def test_runs_20_waves_across_many_seeds_without_crashing(self):
         for seed in range(10):
             game = _run_simulation(seed=seed, max_wave=20)
@@ -12,7 +12,12 @@ import tempfile
 
 import pytest
 
-from src.ui.audio import AudioManager, SoundEvent, _SOUND_FILES
+from src.ui.audio import (
+    AudioManager,
+    SoundEvent,
+    _SOUND_FILES,
+    default_driver_cache_file,
+)
 from src.ui.high_scores import (
     check_high_score,
     get_top_score,
@@ -56,6 +61,18 @@ class TestLoadScores:
         result = load_scores(filepath)
         assert result["1"]["score"] == 500
 
+    def test_load_mixed_score_types(self, tmp_path):
+        filepath = str(tmp_path / "scores.json")
+        data = {str(i): {"name": "---", "score": 0} for i in range(1, 11)}
+        data["1"]["score"] = 750
+        data["2"]["score"] = " 600 "
+        data["3"]["score"] = None
+        del data["4"]["score"]
+        with open(filepath, "w") as f:
+            json.dump(data, f)
+        result = load_scores(filepath)
+        assert [result[k]["score"] for k in "1234"] == [750, 600, 0, 0]
+
     def test_load_malformed_returns_defaults(self, tmp_path):
         filepath = str(tmp_path / "scores.json")
         with open(filepath, "w") as f:
@@ -131,6 +148,15 @@ class TestUpdateHighScores:
         # Previous #6 shifts to #7
         assert updated["7"]["name"] == "P6"
 
+    def test_insert_shifts_table_and_drops_last(self):
+        for score, rank in ((9999, 1), (550, 6), (150, 10)):
+            scores = self._make_scores()
+            update_high_scores(score, "NEW", scores)
+            names = [f"P{i}" for i in range(1, 10)]
+            names.insert(rank - 1, "NEW")
+            assert [scores[str(i)]["name"] for i in range(1, 11)] == names
+            assert scores[str(rank)]["score"] == score
+
     def test_no_insert_for_low_score(self):
         scores = self._make_scores()
         updated = update_high_scores(50, "LOW", scores)
@@ -208,6 +234,103 @@ class TestAudioManager:
         assert "AudioManager: file not found:" in captured.out
         assert f"AudioManager: loaded 0/{len(_SOUND_FILES)} sounds" in captured.out
 
+    def test_load_sounds_only_opens_listed_files(self, monkeypatch, tmp_path):
+        import pygame.mixer
+        (tmp_path / "explosion.wav").write_bytes(b"")
+        (tmp_path / "flier.wav").mkdir()
+        opened = []
+        monkeypatch.setattr(pygame.mixer, "Sound", lambda path: opened.append(path) or path)
+        am = AudioManager(sfx_dir=str(tmp_path))
+        am._initialized = True
+        am._load_sounds()
+        assert opened == [os.path.join(str(tmp_path), "explosion.wav")]
+        assert list(am._sounds) == [SoundEvent.EXPLOSION]
+
+    def test_load_sounds_with_missing_dir_when_initialized(self):
+        am = AudioManager(sfx_dir="/nonexistent/path")
+        am._initialized = True
+        am._load_sounds()
+        assert len(am._sounds) == 0
+
+
+class TestAudioDriverCache:
+    @staticmethod
+    def _fake_mixer(monkeypatch, working):
+        import pygame.mixer
+        tried = []
+
+        def fake_init(**kwargs):
+            driver = os.environ.get("SDL_AUDIODRIVER")
+            tried.append(driver)
+            if driver != working:
+                raise RuntimeError("no such driver")
+
+        monkeypatch.setattr(pygame.mixer, "get_init", lambda: None)
+        monkeypatch.setattr(pygame.mixer, "init", fake_init)
+        monkeypatch.delenv("SDL_AUDIODRIVER", raising=False)
+        monkeypatch.setattr(AudioManager, "_load_sounds", lambda self: None)
+        monkeypatch.setattr(AudioManager, "_synthesize_missing_sounds", lambda self: None)
+        return tried
+
+    def test_successful_fallback_driver_is_cached(self, monkeypatch, tmp_path):
+        tried = self._fake_mixer(monkeypatch, "alsa")
+        cache = tmp_path / "cache" / "sdl_audio_driver"
+        assert AudioManager(driver_cache_file=str(cache)).init()
+        assert tried == [None, "pulseaudio", "alsa"]
+        assert cache.read_text().strip() == "alsa"
+
+    def test_cached_driver_is_tried_right_after_default(self, monkeypatch, tmp_path):
+        tried = self._fake_mixer(monkeypatch, "dsp")
+        cache = tmp_path / "sdl_audio_driver"
+        cache.write_text("dsp\n")
+        assert AudioManager(driver_cache_file=str(cache)).init()
+        assert tried == [None, "dsp"]
+
+    def test_stale_cached_driver_falls_back_to_probe(self, monkeypatch, tmp_path):
+        tried = self._fake_mixer(monkeypatch, "alsa")
+        cache = tmp_path / "sdl_audio_driver"
+        cache.write_text("dsp\n")
+        assert AudioManager(driver_cache_file=str(cache)).init()
+        assert tried == [None, "dsp", "pulseaudio", "alsa"]
+        assert cache.read_text().strip() == "alsa"
+
+    def test_default_driver_clears_cache(self, monkeypatch, tmp_path):
+        tried = self._fake_mixer(monkeypatch, None)
+        cache = tmp_path / "sdl_audio_driver"
+        cache.write_text("alsa\n")
+        assert AudioManager(driver_cache_file=str(cache)).init()
+        assert tried == [None]
+        assert not cache.exists()
+
+    def test_silent_driver_is_never_cached(self, monkeypatch, tmp_path):
+        tried = self._fake_mixer(monkeypatch, "dummy")
+        cache = tmp_path / "sdl_audio_driver"
+        assert AudioManager(driver_cache_file=str(cache)).init()
+        assert tried[-1] == "dummy"
+        assert not cache.exists()
+
+    def test_silent_driver_keeps_cached_real_driver(self, monkeypatch, tmp_path):
+        # The device may only be unplugged; keep trying it next launch.
+        self._fake_mixer(monkeypatch, "dummy")
+        cache = tmp_path / "sdl_audio_driver"
+        cache.write_text("alsa\n")
+        assert AudioManager(driver_cache_file=str(cache)).init()
+        assert cache.read_text().strip() == "alsa"
+
+    def test_cached_silent_driver_is_ignored(self, monkeypatch, tmp_path):
+        tried = self._fake_mixer(monkeypatch, "alsa")
+        cache = tmp_path / "sdl_audio_driver"
+        cache.write_text("dummy\n")
+        assert AudioManager(driver_cache_file=str(cache)).init()
+        assert tried == [None, "pulseaudio", "alsa"]
+        assert cache.read_text().strip() == "alsa"
+
+    def test_default_cache_file_is_per_user(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert default_driver_cache_file().startswith(str(tmp_path))
+
 
 # ── Game Over Integration ──────────────────────────────────────────────────
 
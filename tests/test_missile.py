@@ -4,6 +4,8 @@ Tests for missile-related functionality from src/models/missile.py.
 Covers ABM, ICBM, SmartBomb, Flier, MIRV logic, and slot management.
 """
 
+import dataclasses
+
 import pytest
 
 from src.config import (
@@ -23,6 +25,8 @@ from src.models.missile import (
     ICBM,
     Flier,
     FlierType,
+    KIND_ICBM,
+    KIND_SMART_BOMB,
     MissileSlotManager,
     SmartBomb,
     compute_increments,
@@ -71,10 +75,11 @@ class TestABMMissile:
     def test_deactivates_at_target(self):
         abm = ABM(silo_index=1, start_x=128, start_y=220,
                    target_x=128, target_y=210)
-        for _ in range(300):
+        # Straight up: arrival within ceil(10 px / step) steps, plus one
+        # for the truncating shift.
+        steps = -(-to_fixed(10) // abs(abm.y_increment)) + 1
+        for _ in range(steps):
             abm.update()
-            if not abm.is_active:
-                break
         assert not abm.is_active
 
     def test_trail_positions(self):
@@ -120,10 +125,10 @@ class TestICBMMissile:
     def test_target_tracking(self):
         icbm = ICBM(entry_x=0, entry_y=0, target_x=200, target_y=200,
                      speed=3)
-        for _ in range(500):
+        # move_delay 0 steps every frame; both axes cover 200 px.
+        steps = -(-to_fixed(200) // min(icbm.x_increment, icbm.y_increment)) + 1
+        for _ in range(steps):
             icbm.update()
-            if not icbm.is_active:
-                break
         assert not icbm.is_active
 
     def test_slot_limit(self):
@@ -139,68 +144,48 @@ class TestICBMMissile:
 
 
 class TestMIRVMissile:
+    # Read-only: ICBM.mirv only indexes into its target list.
+    _TARGETS = [(80, 220), (120, 220), (160, 220)]
+
     def _make_icbm_at_altitude(self, alt):
         return ICBM(
             entry_x=100, entry_y=alt, target_x=100, target_y=220,
             speed=1, can_mirv=True,
         )
 
-    def test_splits_in_range_128_159(self):
-        icbm = self._make_icbm_at_altitude(140)
+    @pytest.mark.parametrize("alt, active, any_above_high, expected", [
+        pytest.param(140, 2, False, True, id="splits_in_range_128_159"),
+        pytest.param(160, 2, False, False, id="no_mirv_above_159"),
+        pytest.param(127, 2, False, False, id="no_mirv_below_128"),
+        pytest.param(140, MAX_ICBM_SLOTS, False, False, id="requires_available_slots"),
+        pytest.param(140, 2, True, False, id="blocked_by_higher_missile"),
+    ])
+    def test_mirv_conditions(self, alt, active, any_above_high, expected):
+        icbm = self._make_icbm_at_altitude(alt)
         assert ICBM.check_mirv_conditions(
-            icbm, active_icbm_count=2,
-            remaining_wave_icbms=5, any_above_high=False,
-        )
-
-    def test_no_mirv_above_159(self):
-        icbm = self._make_icbm_at_altitude(160)
-        assert not ICBM.check_mirv_conditions(
-            icbm, active_icbm_count=2,
-            remaining_wave_icbms=5, any_above_high=False,
-        )
-
-    def test_no_mirv_below_128(self):
-        icbm = self._make_icbm_at_altitude(127)
-        assert not ICBM.check_mirv_conditions(
-            icbm, active_icbm_count=2,
-            remaining_wave_icbms=5, any_above_high=False,
-        )
-
-    def test_requires_available_slots(self):
-        icbm = self._make_icbm_at_altitude(140)
-        assert not ICBM.check_mirv_conditions(
-            icbm, active_icbm_count=MAX_ICBM_SLOTS,
-            remaining_wave_icbms=5, any_above_high=False,
-        )
+            icbm, active_icbm_count=active,
+            remaining_wave_icbms=5, any_above_high=any_above_high,
+        ) is expected
 
     def test_spawns_up_to_3(self):
         icbm = self._make_icbm_at_altitude(140)
-        targets = [(80, 220), (120, 220), (160, 220)]
-        children = icbm.mirv(targets, active_icbm_count=2,
+        children = icbm.mirv(self._TARGETS, active_icbm_count=2,
                              remaining_wave_icbms=5)
         assert len(children) == MIRV_MAX_CHILDREN
 
     def test_each_mirv_different_target(self):
         icbm = self._make_icbm_at_altitude(140)
-        targets = [(80, 220), (120, 220), (160, 220)]
-        children = icbm.mirv(targets, active_icbm_count=2,
+        children = icbm.mirv(self._TARGETS, active_icbm_count=2,
                              remaining_wave_icbms=5)
         target_xs = [c.target_x for c in children]
         assert len(set(target_xs)) == 3
 
     def test_mirv_marks_parent(self):
         icbm = self._make_icbm_at_altitude(140)
-        targets = [(80, 220)]
-        icbm.mirv(targets, active_icbm_count=2, remaining_wave_icbms=5)
+        icbm.mirv(self._TARGETS[:1], active_icbm_count=2,
+                  remaining_wave_icbms=5)
         assert icbm.has_mirved
 
-    def test_blocked_by_higher_missile(self):
-        icbm = self._make_icbm_at_altitude(140)
-        assert not ICBM.check_mirv_conditions(
-            icbm, active_icbm_count=2,
-            remaining_wave_icbms=5, any_above_high=True,
-        )
-
 
 # ── Smart Bomb Tests ────────────────────────────────────────────────────────
 
@@ -218,6 +203,13 @@ class TestSmartBombMissile:
         assert mgr.add_icbm(sb2) is True
         assert mgr.add_icbm(sb3) is False
 
+    def test_kind_tag_distinguishes_smart_bombs(self):
+        icbm = ICBM(entry_x=0, entry_y=0, target_x=128, target_y=200)
+        sb = SmartBomb(entry_x=0, entry_y=0, target_x=128, target_y=200)
+        assert icbm.kind == KIND_ICBM
+        assert sb.kind == KIND_SMART_BOMB
+        assert "kind" not in {f.name for f in dataclasses.fields(sb)}
+
     def test_normal_movement(self):
         sb = SmartBomb(entry_x=100, entry_y=0, target_x=100, target_y=200,
                        speed=2)
@@ -225,18 +217,42 @@ class TestSmartBombMissile:
         sb.update()
         assert sb.current_y > old_y
 
-    def test_evasion_activates(self):
-        sb = SmartBomb(entry_x=100, entry_y=0, target_x=100, target_y=200,
-                       speed=1)
-        sb.detect_explosions([(90, 50)])
-        assert sb.evasion_active
-
-    def test_evasion_deactivates(self):
+    @pytest.mark.parametrize("frames, expected", [
+        pytest.param([[(90, 50)]], True, id="activates"),
+        pytest.param([[(90, 50)], []], False, id="deactivates"),
+    ])
+    def test_evasion_state(self, frames, expected):
         sb = SmartBomb(entry_x=100, entry_y=0, target_x=100, target_y=200,
                        speed=1)
-        sb.detect_explosions([(90, 50)])
-        sb.detect_explosions([])
-        assert not sb.evasion_active
+        for centers in frames:
+            sb.detect_explosions(centers)
+        assert sb.evasion_active is expected
+
+    def test_detect_explosions_keeps_callers_sequence(self):
+        sb = SmartBomb(entry_x=100, entry_y=0, target_x=100, target_y=200)
+        centers = [(90, 50)]
+        sb.detect_explosions(centers)
+        assert sb.nearby_explosions is centers
+
+    def test_evasion_steers_from_nearest_explosion(self):
+        import random
+        rng = random.Random(4)
+        for _ in range(200):
+            args = dict(entry_x=rng.randint(0, 255), entry_y=rng.randint(0, 150),
+                        target_x=rng.randint(0, 255), target_y=220, speed=2)
+            centers = [
+                (rng.randint(-100, 355), rng.randint(-100, 355))
+                for _ in range(rng.randint(1, 6))
+            ]
+            sb = SmartBomb(**args)
+            x, y = sb.current_x, sb.current_y
+            nearest = min(centers, key=lambda c: distance_approx(x, y, *c))
+            only = SmartBomb(**args)
+            sb.detect_explosions(centers)
+            only.detect_explosions([nearest])
+            sb.update()
+            only.update()
+            assert sb.current_pos == only.current_pos
 
     def test_evasion_movement(self):
         sb = SmartBomb(entry_x=100, entry_y=50, target_x=100, target_y=200,
@@ -294,41 +310,37 @@ class TestFlierMissile:
         missiles = f.fire([(50, 220), (150, 220)])
         assert len(missiles) == 2
 
-    def test_resurrection_cooldown_decreases(self):
-        f1 = Flier.create_random(wave_number=1)
-        f2 = Flier.create_random(wave_number=5)
-        assert f2.resurrection_timer <= f1.resurrection_timer
-
-    def test_firing_cooldown_decreases(self):
+    @pytest.mark.parametrize("timer", ["resurrection_timer", "firing_timer"])
+    def test_cooldown_decreases(self, timer):
+        # Timers come from the wave table; only type/direction/altitude
+        # are random.
         f1 = Flier.create_random(wave_number=1)
         f2 = Flier.create_random(wave_number=5)
-        assert f2.firing_timer <= f1.firing_timer
+        assert getattr(f2, timer) <= getattr(f1, timer)
 
 
 # ── Fixed-Point Math Tests ──────────────────────────────────────────────────
 
 
 class TestFixedPointMath:
-    def test_to_fixed_accurate(self):
-        assert to_fixed(0) == 0
-        assert to_fixed(1) == 256
-        assert to_fixed(10) == 2560
-
-    def test_from_fixed_accurate(self):
-        assert from_fixed(256) == 1
-        assert from_fixed(2560) == 10
-
-    def test_round_trip(self):
-        for v in (0, 1, 7, 100, 255):
-            assert from_fixed(to_fixed(v)) == v
-
-    def test_distance_capped_255(self):
-        d = distance_approx(0, 0, 500, 500)
-        assert d == 255
-
-    def test_distance_approximation(self):
-        d = distance_approx(0, 0, 100, 100)
-        assert d == 137  # max + 3/8 * min
+    @pytest.mark.parametrize("value, fixed", [(0, 0), (1, 256), (10, 2560)])
+    def test_to_fixed_accurate(self, value, fixed):
+        assert to_fixed(value) == fixed
+
+    @pytest.mark.parametrize("fixed, value", [(256, 1), (2560, 10)])
+    def test_from_fixed_accurate(self, fixed, value):
+        assert from_fixed(fixed) == value
+
+    @pytest.mark.parametrize("value", [0, 1, 7, 100, 255])
+    def test_round_trip(self, value):
+        assert from_fixed(to_fixed(value)) == value
+
+    @pytest.mark.parametrize("x2, y2, expected", [
+        pytest.param(500, 500, 255, id="capped_255"),
+        pytest.param(100, 100, 137, id="max_plus_3_8_min"),
+    ])
+    def test_distance_approx(self, x2, y2, expected):
+        assert distance_approx(0, 0, x2, y2) == expected
 
     def test_increment_calculation(self):
         x_inc, y_inc = compute_increments(0, 0, 100, 0, 3)
@@ -6,17 +6,23 @@ MIRV logic, slot limits, octagonal explosions, city destruction limits,
 silo capacity, and score tracking.
 """
 
+import random
+
+import numpy as np
 import pytest
 
 from src.config import (
     ABM_SPEED_CENTER,
     ABM_SPEED_SIDE,
     BONUS_CITY_POINTS,
+    EXPLOSION_COLLISION_ALTITUDE_MIN,
     EXPLOSION_MAX_RADIUS,
     FLIER_BOMBER_CROSS_FRAMES,
     MAX_ABM_SLOTS,
     MAX_CITIES_DESTROYED_PER_WAVE,
+    MAX_EXPLOSION_SLOTS,
     MAX_ICBM_SLOTS,
+    MAX_SMART_BOMBS,
     MIRV_ALTITUDE_HIGH,
     MIRV_ALTITUDE_LOW,
     SCREEN_WIDTH,
@@ -68,8 +74,10 @@ class TestFixedPoint:
         assert to_fixed(10) == 2560
 
     def test_from_fixed_round_trip(self):
-        for v in (0, 1, 7, 100, 255):
-            assert from_fixed(to_fixed(v)) == v
+        # The helpers are bare shifts, so one array call covers every
+        # native coordinate.
+        coords = np.arange(256)
+        np.testing.assert_array_equal(from_fixed(to_fixed(coords)), coords)
 
     def test_from_fixed_truncates(self):
         # 256 + 128 => integer part 1, fractional 0.5 => truncates to 1
@@ -101,6 +109,19 @@ class TestDistance:
     def test_symmetry(self):
         assert distance_approx(10, 20, 50, 80) == distance_approx(50, 80, 10, 20)
 
+    def test_matches_reference_over_grid(self):
+        # Offsets on both sides of the origin, past the 255 cap.
+        offsets = np.arange(-296, 300, 8)
+        dx, dy = np.meshgrid(offsets, offsets)
+        hi = np.maximum(np.abs(dx), np.abs(dy))
+        lo = np.minimum(np.abs(dx), np.abs(dy))
+        expected = np.minimum(hi + ((3 * lo) >> 3), 255)
+        got = np.array([
+            [distance_approx(0, 0, x, y) for x in offsets.tolist()]
+            for y in offsets.tolist()
+        ])
+        np.testing.assert_array_equal(got, expected)
+
 
 # ── Increment calculation ──────────────────────────────────────────────────
 
@@ -119,6 +140,16 @@ class TestIncrements:
         assert x_inc == 0
         assert y_inc > 0
 
+    def test_matches_two_division_form(self):
+        for sx, sy, tx, ty in ((5, 5, 5, 200), (5, 5, 250, 5), (0, 0, 255, 255),
+                               (200, 10, 3, 220), (40, 220, 40, 0)):
+            for speed in (1, 3, 7):
+                dist = distance_approx(sx, sy, tx, ty)
+                scale = speed * 256
+                assert compute_increments(sx, sy, tx, ty, speed) == (
+                    ((tx - sx) * scale) // dist, ((ty - sy) * scale) // dist,
+                )
+
 
 # ── has_passed_target ──────────────────────────────────────────────────────
 
@@ -156,6 +187,17 @@ class TestPassedTarget:
         # dy == 0 (straight horizontal flight): Y never blocks arrival.
         assert has_passed_target(101, 100, 100, 100, 1, 0)
 
+    def test_matches_per_axis_sign_rule(self):
+        def passed(c, t, inc):
+            return c >= t if inc > 0 else c <= t if inc < 0 else True
+
+        for c in (98, 100, 102):
+            for inc in (-300, -1, 0, 1, 300):
+                for cy, y_inc in ((95, 2), (105, 2), (100, 0), (95, -2)):
+                    assert has_passed_target(c, cy, 100, 100, inc, y_inc) == (
+                        passed(c, 100, inc) and passed(cy, 100, y_inc)
+                    )
+
 
 # ── ABM ─────────────────────────────────────────────────────────────────────
 
@@ -185,10 +227,12 @@ class TestABM:
     def test_deactivates_at_target(self):
         abm = ABM(silo_index=1, start_x=128, start_y=220,
                    target_x=128, target_y=210)
-        for _ in range(300):
-            abm.update()
-            if not abm.is_active:
-                break
+        # Two steps shy of the target: still flying after one update,
+        # arrived after the second.
+        abm.current_y_fp = to_fixed(210) - 2 * abm.y_increment
+        abm.update()
+        assert abm.is_active
+        abm.update()
         assert not abm.is_active
 
     def test_update_is_noop_when_inactive(self):
@@ -219,10 +263,12 @@ class TestICBM:
     def test_deactivates_at_target(self):
         icbm = ICBM(entry_x=128, entry_y=0, target_x=128, target_y=50,
                      speed=5)
-        for _ in range(500):
-            icbm.update()
-            if not icbm.is_active:
-                break
+        # Two steps shy of the target: still flying after one update,
+        # arrived after the second.
+        icbm.current_y_fp = to_fixed(50) - 2 * icbm.y_increment
+        icbm.update()
+        assert icbm.is_active
+        icbm.update()
         assert not icbm.is_active
 
     def test_update_is_noop_when_inactive(self):
@@ -299,88 +345,48 @@ class TestMIRV:
         )
         return icbm
 
-    def test_mirv_in_range(self):
-        icbm = self._make_icbm_at_altitude(140)  # in [128, 159]
-        assert ICBM.check_mirv_conditions(
-            icbm, active_icbm_count=2,
-            remaining_wave_icbms=5, any_above_high=False,
-        )
-
-    def test_mirv_blocked_on_wave_1(self):
-        """The shipped ROM's wave check at $56d1 is a documented bug
-        (compares wave < 1, always false); the disassembly's own
-        comment says it should be #$02. MIRVs must not appear on
-        wave 1, matching the intended design, not the shipped bug."""
-        icbm = self._make_icbm_at_altitude(140)  # otherwise fully eligible
-        assert not ICBM.check_mirv_conditions(
-            icbm, active_icbm_count=2,
-            remaining_wave_icbms=5, any_above_high=False,
-            wave_number=1,
-        )
-
-    def test_mirv_allowed_from_wave_2(self):
-        icbm = self._make_icbm_at_altitude(140)
-        assert ICBM.check_mirv_conditions(
-            icbm, active_icbm_count=2,
-            remaining_wave_icbms=5, any_above_high=False,
-            wave_number=2,
-        )
-
-    def test_mirv_below_range(self):
-        icbm = self._make_icbm_at_altitude(127)
-        assert not ICBM.check_mirv_conditions(
-            icbm, active_icbm_count=2,
-            remaining_wave_icbms=5, any_above_high=False,
-        )
-
-    def test_mirv_above_range(self):
-        icbm = self._make_icbm_at_altitude(160)
-        assert not ICBM.check_mirv_conditions(
-            icbm, active_icbm_count=2,
-            remaining_wave_icbms=5, any_above_high=False,
-        )
-
-    def test_mirv_slots_full(self):
-        icbm = self._make_icbm_at_altitude(140)
-        assert not ICBM.check_mirv_conditions(
-            icbm, active_icbm_count=MAX_ICBM_SLOTS,
-            remaining_wave_icbms=5, any_above_high=False,
-        )
-
-    def test_mirv_no_remaining(self):
-        icbm = self._make_icbm_at_altitude(140)
-        assert not ICBM.check_mirv_conditions(
-            icbm, active_icbm_count=2,
-            remaining_wave_icbms=0, any_above_high=False,
-        )
-
-    def test_mirv_blocked_by_higher_missile(self):
-        icbm = self._make_icbm_at_altitude(140)
-        assert not ICBM.check_mirv_conditions(
-            icbm, active_icbm_count=2,
-            remaining_wave_icbms=5, any_above_high=True,
-        )
+    _TARGETS = [(80, 220), (120, 220), (160, 220)]
+    # Keyword arguments under which a 140-altitude ICBM may split.
+    _ELIGIBLE = dict(active_icbm_count=2, remaining_wave_icbms=5,
+                     any_above_high=False)
+
+    @pytest.mark.parametrize("alt, overrides, expected", [
+        pytest.param(140, {}, True, id="in_range"),
+        # The shipped ROM's wave check at $56d1 is a documented bug
+        # (compares wave < 1, always false); the disassembly's own
+        # comment says it should be #$02. MIRVs must not appear on
+        # wave 1, matching the intended design, not the shipped bug.
+        pytest.param(140, {"wave_number": 1}, False, id="blocked_on_wave_1"),
+        pytest.param(140, {"wave_number": 2}, True, id="allowed_from_wave_2"),
+        pytest.param(127, {}, False, id="below_range"),
+        pytest.param(160, {}, False, id="above_range"),
+        pytest.param(140, {"active_icbm_count": MAX_ICBM_SLOTS}, False,
+                     id="slots_full"),
+        pytest.param(140, {"remaining_wave_icbms": 0}, False,
+                     id="no_remaining"),
+        pytest.param(140, {"any_above_high": True}, False,
+                     id="blocked_by_higher_missile"),
+    ])
+    def test_mirv_conditions(self, alt, overrides, expected):
+        icbm = self._make_icbm_at_altitude(alt)
+        kwargs = {**self._ELIGIBLE, **overrides}
+        assert ICBM.check_mirv_conditions(icbm, **kwargs) is expected
 
     def test_mirv_already_done(self):
         icbm = self._make_icbm_at_altitude(140)
         icbm.has_mirved = True
-        assert not ICBM.check_mirv_conditions(
-            icbm, active_icbm_count=2,
-            remaining_wave_icbms=5, any_above_high=False,
-        )
+        assert not ICBM.check_mirv_conditions(icbm, **self._ELIGIBLE)
 
     def test_mirv_creates_children(self):
         icbm = self._make_icbm_at_altitude(140)
-        targets = [(80, 220), (120, 220), (160, 220)]
-        children = icbm.mirv(targets, active_icbm_count=2,
+        children = icbm.mirv(self._TARGETS, active_icbm_count=2,
                              remaining_wave_icbms=5)
         assert len(children) == 3
         assert icbm.has_mirved
 
     def test_mirv_limited_by_slots(self):
         icbm = self._make_icbm_at_altitude(140)
-        targets = [(80, 220), (120, 220), (160, 220)]
-        children = icbm.mirv(targets, active_icbm_count=7,
+        children = icbm.mirv(self._TARGETS, active_icbm_count=7,
                              remaining_wave_icbms=5)
         assert len(children) == 1  # only 1 slot free
 
@@ -389,32 +395,30 @@ class TestMIRV:
 
 
 class TestSmartBomb:
-    def test_evasion_activates(self):
-        sb = SmartBomb(
-            entry_x=100, entry_y=0, target_x=100, target_y=200, speed=1,
+    def _make_smart_bomb(self, speed):
+        """Create a smart bomb falling straight down from (100, 0)."""
+        return SmartBomb(
+            entry_x=100, entry_y=0, target_x=100, target_y=200, speed=speed,
         )
+
+    def test_evasion_activates(self):
+        sb = self._make_smart_bomb(speed=1)
         sb.detect_explosions([(90, 50)])
         assert sb.evasion_active
 
     def test_evasion_deactivates(self):
-        sb = SmartBomb(
-            entry_x=100, entry_y=0, target_x=100, target_y=200, speed=1,
-        )
+        sb = self._make_smart_bomb(speed=1)
         sb.detect_explosions([])
         assert not sb.evasion_active
 
     def test_update_moves_when_not_evading(self):
-        sb = SmartBomb(
-            entry_x=100, entry_y=0, target_x=100, target_y=200, speed=2,
-        )
+        sb = self._make_smart_bomb(speed=2)
         old_y = sb.current_y
         sb.update()
         assert sb.current_y > old_y
 
     def test_update_is_noop_when_inactive(self):
-        sb = SmartBomb(
-            entry_x=100, entry_y=0, target_x=100, target_y=200, speed=2,
-        )
+        sb = self._make_smart_bomb(speed=2)
         sb.deactivate()
         old_pos = sb.current_pos
         sb.update()
@@ -436,32 +440,42 @@ class TestSmartBomb:
 
 
 class TestSlotManager:
-    def test_abm_limit(self):
-        mgr = MissileSlotManager()
-        for i in range(MAX_ABM_SLOTS):
-            abm = ABM(silo_index=1, start_x=128, start_y=220,
-                       target_x=128, target_y=50)
-            assert mgr.add_abm(abm) is True
-        extra = ABM(silo_index=1, start_x=128, start_y=220,
-                     target_x=128, target_y=50)
-        assert mgr.add_abm(extra) is False
-
-    def test_icbm_limit(self):
-        mgr = MissileSlotManager()
-        for _ in range(MAX_ICBM_SLOTS):
-            icbm = ICBM(entry_x=0, entry_y=0, target_x=128, target_y=200)
-            assert mgr.add_icbm(icbm) is True
-        extra = ICBM(entry_x=0, entry_y=0, target_x=128, target_y=200)
-        assert mgr.add_icbm(extra) is False
-
-    def test_smart_bomb_limit(self):
-        mgr = MissileSlotManager()
-        sb1 = SmartBomb(entry_x=0, entry_y=0, target_x=128, target_y=200, speed=1)
-        sb2 = SmartBomb(entry_x=0, entry_y=0, target_x=128, target_y=200, speed=1)
-        sb3 = SmartBomb(entry_x=0, entry_y=0, target_x=128, target_y=200, speed=1)
-        assert mgr.add_icbm(sb1) is True
-        assert mgr.add_icbm(sb2) is True
-        assert mgr.add_icbm(sb3) is False  # max 2 smart bombs
+    def test_entities_have_no_instance_dict(self):
+        entities = [
+            ABM(silo_index=0, start_x=32, start_y=220, target_x=100, target_y=50),
+            ICBM(entry_x=50, entry_y=0, target_x=100, target_y=220),
+            SmartBomb(entry_x=50, entry_y=0, target_x=100, target_y=220),
+            Flier.create_random(wave_number=2),
+            Explosion(center_x=100, center_y=100),
+            City(position_x=48, position_y=216),
+        ]
+        for entity in entities:
+            assert not hasattr(entity, "__dict__"), type(entity).__name__
+
+    @pytest.mark.parametrize("add, make, limit", [
+        pytest.param(
+            "add_abm",
+            lambda: ABM(silo_index=1, start_x=128, start_y=220,
+                        target_x=128, target_y=50),
+            MAX_ABM_SLOTS, id="abm",
+        ),
+        pytest.param(
+            "add_icbm",
+            lambda: ICBM(entry_x=0, entry_y=0, target_x=128, target_y=200),
+            MAX_ICBM_SLOTS, id="icbm",
+        ),
+        pytest.param(
+            "add_icbm",
+            lambda: SmartBomb(entry_x=0, entry_y=0, target_x=128,
+                              target_y=200, speed=1),
+            MAX_SMART_BOMBS, id="smart_bomb",
+        ),
+    ])
+    def test_slot_limit(self, add, make, limit):
+        add = getattr(MissileSlotManager(), add)
+        for _ in range(limit):
+            assert add(make()) is True
+        assert add(make()) is False
 
     def test_flier_single(self):
         mgr = MissileSlotManager()
@@ -519,6 +533,25 @@ class TestExplosion:
         assert min(xs) == 87 and max(xs) == 113
         assert min(ys) == 87 and max(ys) == 113
 
+    def test_collides_with_matches_point_in_octagon_as_radius_changes(self):
+        exp = Explosion(center_x=100, center_y=100)
+        for radius in (3, 13, 7, 13, 1):
+            exp.current_radius = radius
+            for x in range(84, 117, 2):
+                for y in range(84, 117, 2):
+                    assert exp.collides_with(x, y) == point_in_octagon(
+                        x, y, 100, 100, radius,
+                    )
+
+    def test_octagon_vertices_cached_until_radius_changes(self):
+        exp = Explosion(center_x=100, center_y=100, max_radius=13, expand_rate=13)
+        exp.update()
+        first = exp.get_octagon_points()
+        assert exp.get_octagon_points() is first
+        assert list(first) == octagon_points(100, 100, 13)
+        exp.current_radius = 5
+        assert list(exp.get_octagon_points()) == octagon_points(100, 100, 5)
+
     def test_point_in_octagon_center(self):
         assert point_in_octagon(100, 100, 100, 100, 13)
 
@@ -528,16 +561,20 @@ class TestExplosion:
     def test_explosion_lifecycle(self):
         exp = Explosion(center_x=100, center_y=100, max_radius=5,
                         expand_rate=1, hold_frames=3, contract_rate=1)
+        # Ticks 1-4 grow the radius; tick 5 reaches max_radius and holds
+        # (3 ticks); the tick ending the hold starts contracting at
+        # radius 5, four more shrink it, and the one reaching 0 finishes.
+        expected = (
+            [ExplosionState.EXPANDING] * 4
+            + [ExplosionState.HOLDING] * 3
+            + [ExplosionState.CONTRACTING] * 5
+            + [ExplosionState.DONE]
+        )
         states = []
-        for _ in range(20):
+        for _ in expected:
             exp.update()
             states.append(exp.state)
-            if not exp.is_active:
-                break
-        assert ExplosionState.EXPANDING in states
-        assert ExplosionState.HOLDING in states
-        assert ExplosionState.CONTRACTING in states
-        assert exp.state == ExplosionState.DONE
+        assert states == expected
         assert not exp.is_active
 
     def test_collision_above_min_altitude(self):
@@ -566,12 +603,14 @@ class TestExplosionManager:
         assert len(updated) >= 1
 
     def test_group_cycling(self):
+        # advance() on an empty manager is just the rotation plus an
+        # empty-group mask check; update() would also build a list.
         mgr = ExplosionManager()
-        groups_seen = set()
+        groups = [mgr.current_group]
         for _ in range(5):
-            groups_seen.add(mgr.current_group)
-            mgr.update()
-        assert len(groups_seen) == 5
+            mgr.advance()
+            groups.append(mgr.current_group)
+        assert groups == [0, 1, 2, 3, 4, 0]
 
     def test_icbm_collision_detection(self):
         mgr = ExplosionManager()
@@ -584,6 +623,144 @@ class TestExplosionManager:
         hits = mgr.check_icbm_collisions(updated, [(100, 100, 0)])
         assert 0 in hits
 
+    def test_icbm_collisions_match_per_explosion_check(self):
+        rng = random.Random(7)
+        mgr = ExplosionManager()
+        explosions = []
+        for _ in range(6):
+            exp = Explosion(center_x=rng.randint(20, 200), center_y=rng.randint(20, 200))
+            exp.current_radius = rng.randint(1, 13)
+            explosions.append(exp)
+        positions = [
+            (rng.randint(0, 220), rng.randint(0, 220), i) for i in range(40)
+        ]
+        expected = [
+            idx for x, y, idx in positions
+            if any(e.collides_with(x, y) for e in explosions)
+        ]
+        assert mgr.check_icbm_collisions(explosions, positions) == expected
+
+    def test_broad_phase_keeps_every_hit(self):
+        from src.models.explosion import (
+            broad_phase_targets, octagon_hit_indices,
+        )
+        rng = random.Random(9)
+        ex = [rng.randint(40, 190) for _ in range(4)]
+        ey = [rng.randint(20, 190) for _ in range(4)]
+        er = [rng.choice((-1, 3, 9, 13)) for _ in range(4)]
+        targets = [
+            (rng.randint(0, 255), rng.randint(0, 230), i) for i in range(200)
+        ]
+        kept = broad_phase_targets(ex, ey, er, targets)
+        assert len(kept) <= len(targets)
+        expected = [
+            idx for idx in octagon_hit_indices(ex, ey, er, targets)
+            if targets[idx][1] >= EXPLOSION_COLLISION_ALTITUDE_MIN
+        ]
+        assert octagon_hit_indices(ex, ey, er, kept) == expected
+
+    def test_advance_matches_update(self):
+        rng = random.Random(11)
+        a, b = ExplosionManager(), ExplosionManager()
+        for _ in range(12):
+            x, y, rate = rng.randint(20, 200), rng.randint(40, 200), rng.randint(1, 5)
+            a.add(Explosion(center_x=x, center_y=y, expand_rate=rate))
+            b.add(Explosion(center_x=x, center_y=y, expand_rate=rate))
+        for _ in range(120):
+            updated = a.update()
+            assert b.advance() == len(updated)
+            assert all(exp.is_active for exp in updated)
+            for x, y in ((100, 100), (60, 150), (180, 90)):
+                assert b.group_collides_with(x, y) == any(
+                    exp.collides_with(x, y) for exp in updated
+                )
+
+    def test_icbm_collisions_report_each_hit_once(self):
+        mgr = ExplosionManager()
+        a = Explosion(center_x=100, center_y=100, current_radius=10)
+        b = Explosion(center_x=102, center_y=100, current_radius=10)
+        assert mgr.check_icbm_collisions([a, b], [(101, 100, 3)]) == [3]
+
+    def test_active_count_tracks_slots_over_lifecycle(self):
+        mgr = ExplosionManager()
+        for i in range(25):
+            mgr.add(Explosion(center_x=50 + i, center_y=100, expand_rate=1 + i % 4))
+            mgr.update()
+            assert mgr.active_count == sum(
+                1 for e in mgr.slots if e is not None and e.is_active
+            )
+        for _ in range(300):
+            mgr.update()
+        assert mgr.active_count == 0
+        mgr.add(Explosion(center_x=10, center_y=100))
+        mgr.reset()
+        assert mgr.active_count == 0
+
+    def test_add_fills_lowest_free_slot_and_reports_full(self):
+        mgr = ExplosionManager()
+        for i in range(MAX_EXPLOSION_SLOTS):
+            assert mgr.add(Explosion(center_x=i, center_y=100)) is True
+            assert mgr.slots[i].center_x == i
+        assert mgr.add(Explosion(center_x=0, center_y=100)) is False
+        mgr.slots[7].is_active = False
+        assert mgr.add(Explosion(center_x=77, center_y=100)) is True
+        assert mgr.slots[7].center_x == 77
+
+    def test_prefilled_slots_are_counted_and_skipped_by_add(self):
+        slots = [None] * MAX_EXPLOSION_SLOTS
+        slots[0] = Explosion(center_x=10, center_y=100)
+        slots[2] = Explosion(center_x=20, center_y=100)
+        mgr = ExplosionManager(slots=slots)
+        assert mgr.active_count == 2
+        assert mgr.add(Explosion(center_x=30, center_y=100)) is True
+        assert mgr.slots[1].center_x == 30
+        assert mgr.add(Explosion(center_x=40, center_y=100)) is True
+        assert mgr.slots[3].center_x == 40
+        assert mgr.slots[0].center_x == 10
+
+    def test_finish_frees_slot_and_drops_its_center(self):
+        mgr = ExplosionManager()
+        mgr.add(Explosion(center_x=10, center_y=100))
+        mgr.add(Explosion(center_x=20, center_y=90))
+        assert mgr.active_explosion_centers == ((10, 100), (20, 90))
+        exp = mgr.slots[0]
+        mgr.finish(0)
+        assert not exp.is_active
+        assert mgr.slots[0] is None
+        assert mgr.active_count == 1
+        assert mgr.active_explosion_centers == ((20, 90),)
+        assert mgr.add(Explosion(center_x=30, center_y=80)) is True
+        assert mgr.slots[0].center_x == 30
+
+    def test_active_centers_reused_until_a_slot_changes(self):
+        mgr = ExplosionManager()
+        mgr.add(Explosion(center_x=10, center_y=100, hold_frames=50))
+        centers = mgr.active_explosion_centers
+        assert centers == ((10, 100),)
+        mgr.update()
+        assert mgr.active_explosion_centers is centers
+        mgr.add(Explosion(center_x=20, center_y=90))
+        assert mgr.active_explosion_centers == ((10, 100), (20, 90))
+        mgr.reset()
+        assert mgr.active_explosion_centers == ()
+
+    def test_group_collisions_match_updated_list_over_lifecycle(self):
+        rng = random.Random(11)
+        mgr = ExplosionManager()
+        for _ in range(14):
+            mgr.add(Explosion(
+                center_x=rng.randint(20, 200), center_y=rng.randint(40, 200),
+                expand_rate=rng.randint(1, 5),
+            ))
+        positions = [
+            (rng.randint(0, 220), rng.randint(0, 220), i) for i in range(30)
+        ]
+        for _ in range(200):
+            updated = mgr.update()
+            assert mgr.check_group_collisions(positions) == (
+                mgr.check_icbm_collisions(updated, positions)
+            )
+
 
 # ── City ────────────────────────────────────────────────────────────────────
 
@@ -605,11 +782,11 @@ class TestCityManager:
 
     def test_three_per_wave_limit(self):
         mgr = CityManager()
-        destroyed = 0
-        for i in range(6):
-            if mgr.destroy_city(i):
-                destroyed += 1
-        assert destroyed == MAX_CITIES_DESTROYED_PER_WAVE
+        outcomes = [mgr.destroy_city(i) for i in range(len(mgr.cities))]
+        # The first MAX_CITIES_DESTROYED_PER_WAVE hits land; the rest are
+        # refused.
+        limit = MAX_CITIES_DESTROYED_PER_WAVE
+        assert outcomes == [True] * limit + [False] * (len(outcomes) - limit)
 
     def test_start_wave_persists_destroyed_cities(self):
         """Destroyed cities stay destroyed across waves; only the
@@ -628,11 +805,15 @@ class TestCityManager:
         assert awarded == 3
         assert mgr.bonus_cities == 3
 
-    def test_bonus_city_overflow(self):
+    @pytest.mark.parametrize("score, expected", [
+        (255, 255), (256, 0), (257, 1), (512, 0), (1000, 232),
+    ])
+    def test_bonus_city_overflow(self, score, expected):
+        # The bonus counter is 8-bit: awards wrap modulo 256.
         mgr = CityManager()
         mgr.bonus_threshold = 1
-        mgr.check_bonus(256)
-        assert mgr.bonus_cities == 0  # 256 & 0xFF == 0
+        mgr.check_bonus(score)
+        assert mgr.bonus_cities == expected
 
     def test_replace_random_crater(self):
         mgr = CityManager()
@@ -762,6 +943,19 @@ class TestScoreDisplay:
         assert sd.player_score == 0
         assert sd.high_score == 500
 
+    def test_formatted_text_follows_score_changes(self):
+        sd = ScoreDisplay()
+        assert sd.format_score() == "SCORE: 0"
+        first = sd.format_score()
+        assert sd.format_score() is first
+        sd.add(250)
+        assert sd.format_score() == "SCORE: 250"
+        assert sd.format_high_score() == "HIGH: 250"
+        sd.high_score = 7500
+        assert sd.format_high_score() == "HIGH: 7500"
+        sd.reset()
+        assert sd.format_score() == "SCORE: 0"
+
 
 # ── Wave helpers ────────────────────────────────────────────────────────────
 
@@ -782,6 +976,8 @@ class TestWaveHelpers:
         assert get_attack_pace_altitude(1) == 200
         assert get_attack_pace_altitude(11) == 180
         assert get_attack_pace_altitude(50) == 180  # clamped
+        assert get_attack_pace_altitude(500) == 180  # past the table
+        assert get_attack_pace_altitude(0) == 202
 
     def test_calculate_wave_bonus(self):
         bonus = calculate_wave_bonus(surviving_cities=4, remaining_abms=10)